@@ -0,0 +1,116 @@
+#!/usr/bin/python
+
+# Basis set sizes from shell lists over the AOSYM angular momenta.
+
+import collections
+import collections.abc
+import functools
+import re
+
+import numpy
+
+import Elements
+import Physcon
+
+# ----------------------------------------------------------------------
+
+#
+#     Purpose: Number of orbital and auxiliary functions and the memory
+#              of one square matrix for a planned calculation, from the
+#              shell lists of its atoms, to pre-screen job sizes.
+#
+#     ******************************************************************
+#
+#     List of variables:
+#
+#     CARTESIAN: Cartesian components (l+1)(l+2)/2 per AOSYM entry.
+#     SPHERICAL: Spherical components 2l+1 per AOSYM entry.
+#     Size     : Result of size() with the fields
+#                nbasis : Number of orbital basis functions.
+#                naux   : Number of auxiliary functions (0 without).
+#                matrix : Bytes of one nbasis x nbasis matrix.
+#                auxmat : Bytes of one naux x naux matrix.
+#
+#     A shell list is a string of shell counts and AOSYM letters, for
+#     example '4s3p1d', '(4s,3p,1d)' or 'sssppd', case insensitive.
+#     A basis is either one shell list per atom or a mapping from element
+#     symbols or atomic numbers to shell lists, used with atomic numbers.
+#
+#     ------------------------------------------------------------------
+#
+_L = numpy.arange(len(Physcon.AOSYM))
+
+CARTESIAN = (_L + 1)*(_L + 2)//2
+SPHERICAL = 2*_L + 1
+
+CARTESIAN.flags.writeable = False
+SPHERICAL.flags.writeable = False
+
+Size = collections.namedtuple('Size', 'nbasis naux matrix auxmat')
+
+_SHELL = re.compile(r'(\d*)([%s])' % ''.join(Physcon.AOSYM), re.I)
+_JUNK = re.compile(r'[\s,()\[\]]+')
+_LVAL = {symbol: l for l, symbol in enumerate(Physcon.AOSYM)}
+#
+#     ------------------------------------------------------------------
+#
+@functools.lru_cache(maxsize=None)
+def shells(spec):
+    """Read-only number of shells per angular momentum of a shell
+    list."""
+    counts = numpy.zeros(len(Physcon.AOSYM), dtype=numpy.int64)
+    text = _JUNK.sub('', spec)
+    pos = 0
+    for match in _SHELL.finditer(text):
+        if match.start() != pos:
+            break
+        counts[_LVAL[match.group(2).lower()]] += int(match.group(1) or 1)
+        pos = match.end()
+    if pos != len(text):
+        raise ValueError('invalid shell list %r' % spec)
+    counts.flags.writeable = False
+    return counts
+
+
+def _matrix(basis, z):
+    """(natom, NAOSYM) shell counts of a basis."""
+    if isinstance(basis, collections.abc.Mapping):
+        if z is None:
+            raise TypeError('an element basis needs atomic numbers z')
+        table = numpy.zeros((Elements.NELEM, len(Physcon.AOSYM)),
+                            dtype=numpy.int64)
+        for element, spec in basis.items():
+            if isinstance(element, str):
+                element = Elements.atomic_number(element)
+            table[element] = shells(spec)
+        z = Elements.TABLE._index(z)
+        missing = numpy.setdiff1d(z, [Elements.atomic_number(element)
+                                      if isinstance(element, str) else element
+                                      for element in basis])
+        if missing.size:
+            raise KeyError('no shell list for elements %s' % ', '.join(
+                Physcon.ELSYM[element].strip() for element in missing))
+        return table[z]
+    specs, inverse = numpy.unique(numpy.asarray(basis, dtype=str),
+                                  return_inverse=True)
+    unique = numpy.array([shells(spec) for spec in specs.tolist()],
+                         dtype=numpy.int64).reshape(-1, len(Physcon.AOSYM))
+    return unique[inverse.ravel()]
+
+
+def functions(basis, z=None, spherical=True):
+    """Number of functions of a basis, see the module header."""
+    components = SPHERICAL if spherical else CARTESIAN
+    return int(_matrix(basis, z).sum(axis=0) @ components)
+
+
+def size(basis, z=None, auxis=None, spherical=True, itemsize=8):
+    """Function counts and square matrix memory of a system.
+
+    basis and auxis are the orbital and auxiliary basis, either one shell
+    list per atom or an element mapping used with the atomic numbers z.
+    Auxiliary functions are counted as Cartesian (Hermite) functions.
+    """
+    nbasis = functions(basis, z, spherical)
+    naux = 0 if auxis is None else functions(auxis, z, spherical=False)
+    return Size(nbasis, naux, nbasis*nbasis*itemsize, naux*naux*itemsize)
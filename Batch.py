@@ -0,0 +1,199 @@
+#!/usr/bin/python
+
+# Parallel summary of whole directories of deMon2k outputs.
+
+import argparse
+import concurrent.futures
+import glob
+import math
+import os
+import subprocess
+import sys
+
+import Parser
+import Plotter
+
+# ----------------------------------------------------------------------
+
+#
+#     Purpose: Parse many optimization and MD outputs on a process pool
+#              and write one summary table, optionally with the plot of
+#              every output. No image viewer is started.
+#
+#     ******************************************************************
+#
+#     List of variables:
+#
+#     HEADER  : Column titles of the summary table.
+#     TOL     : Default MAX FORCE convergence threshold [a.u.].
+#
+#     Outputs with an MD table are MD runs, read in the -md ensemble or,
+#     by default, in the ensemble of their first table header (NPT with
+#     a PRES column, NVE/NVT otherwise; Parser.ensemble()). All other
+#     outputs are OPT runs. The final energy is the last TOTAL ENERGY
+#     (OPT) or E_SYS (MD). An OPT run counts as converged when its last
+#     MAX FORCE is below -tol. MD averages and standard deviations are
+#     taken over t >= -start. Outputs whose job raises an error are
+#     reported on stderr and listed with type "failed".
+#
+#     Usage: python Batch.py [-jobs n] [-md NVE|NVT|NPT] [-start t0]
+#            [-tol tol] [-pattern glob] [-summary file] [-plots dir]
+#            [-nocache] directory|glob|file ...
+#
+#     ------------------------------------------------------------------
+#
+HEADER = ('file', 'type', 'steps', 'final energy', 'max force', 'conv',
+          '<T>', 'sd(T)', '<p>', 'sd(p)', '<E>', 'sd(E)')
+
+TOL = 3.0E-4
+#
+#     ------------------------------------------------------------------
+#
+def outputs(paths, pattern='*.out'):
+    """Output files named by paths: files, directories (searched for
+    pattern) and glob expressions, sorted and without duplicates."""
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files.extend(glob.glob(os.path.join(path, pattern)))
+        elif os.path.isfile(path):
+            files.append(path)
+        else:
+            files.extend(glob.glob(path))
+    return sorted(set(files))
+
+
+def _plot(path, columns, mdtype, start, plots):
+    base = os.path.join(plots, os.path.basename(path).rsplit('.', 1)[0])
+    title = os.path.basename(base)
+    if mdtype is None:
+        files = [base + '.dat', base + '.rms', base + '.max']
+        Plotter.write_opt(path, *files, columns=columns)
+    else:
+        files = [base + '.dat']
+        Plotter.write_md(path, files[0], mdtype, start, columns=columns)
+    Plotter.write_gnuplot(base + '.gpl', base + '.png', title, files, mdtype)
+    try:
+        subprocess.run(['gnuplot', base + '.gpl'], check=True,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    except (OSError, subprocess.CalledProcessError) as error:
+        print(' %s: png file could not be generated: %s' % (path, error),
+              file=sys.stderr)
+
+
+def _row(path, kind='-'):
+    row = dict.fromkeys(HEADER, math.nan)
+    row.update(file=path, type=kind, steps=0, conv='-')
+    return row
+
+
+def summarize(path, start=0.0, tol=TOL, plots=None, cache=True,
+              mdtype=None):
+    """Summary row (a dict keyed by HEADER) of one output; MD outputs
+    are read as mdtype runs, by default the ensemble of their table
+    header."""
+    row = _row(path)
+    detected = Parser.ensemble(path)
+    if detected is None:
+        mdtype = None
+        columns = Plotter.series(path, cache, Plotter.OPTKINDS)
+    else:
+        mdtype = mdtype or detected
+        columns = Plotter.series(path, cache, ('md',))
+    if mdtype is not None:
+        md = Plotter.MDSeries(mdtype, start)
+        md.extend(columns)
+        row.update(type='NPT' if mdtype == 'NPT' else 'NVE/NVT',
+                   steps=md.count)
+        esys = columns['md_%d' % (md.fields.index('esys') + 1)]
+        if esys.size:
+            row['final energy'] = float(esys[-1])
+        if md.count:
+            for (label, _), mean, std in zip(md.columns, *md.summary()):
+                row['<%s>' % label] = mean
+                row['sd(%s)' % label] = std
+    elif columns['opt_energy'].size:
+        row.update(type='OPT', steps=columns['opt_energy'].size,
+                   **{'final energy': float(columns['opt_energy'][-1])})
+        if columns['opt_max'].size:
+            force = float(columns['opt_max'][-1])
+            row.update(conv='yes' if force <= tol else 'no',
+                       **{'max force': force})
+    else:
+        return row
+    if plots is not None:
+        _plot(path, columns, mdtype, start, plots)
+    return row
+
+
+def _number(fmt, value):
+    text = fmt % value
+    return '%*s' % (len(text), '-') if math.isnan(value) else text
+
+
+def table(rows):
+    """Summary rows formatted as a text table."""
+    width = max([len(row['file']) for row in rows] + [len(HEADER[0])])
+    head = ('%%-%ds %%-7s %%7s %%18s %%12s %%4s' % width
+            + ' %12s'*6) % HEADER
+    lines = [head, '-'*len(head)]
+    for row in rows:
+        line = '%%-%ds %%-7s %%7d' % width % (row['file'], row['type'],
+                                              row['steps'])
+        line += _number(' %18.8f', row['final energy'])
+        line += _number(' %12.6f', row['max force'])
+        line += ' %4s' % row['conv']
+        line += ''.join(_number(' %12.4f', row[key]) for key in HEADER[6:])
+        lines.append(line)
+    return '\n'.join(lines) + '\n'
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Parallel summary of deMon2k outputs.')
+    parser.add_argument('paths', nargs='+')
+    parser.add_argument('-pattern', default='*.out')
+    parser.add_argument('-jobs', type=int, default=os.cpu_count())
+    parser.add_argument('-md', choices=sorted(Plotter.COLUMNS),
+                        type=str.upper)
+    parser.add_argument('-start', type=float, default=0.0)
+    parser.add_argument('-tol', type=float, default=TOL)
+    parser.add_argument('-summary')
+    parser.add_argument('-plots', metavar='DIR')
+    parser.add_argument('-nocache', dest='cache', action='store_false')
+    args = parser.parse_args(argv)
+
+    files = outputs(args.paths, args.pattern)
+    if not files:
+        print(' No output files found.')
+        return 2
+    plots = args.plots
+    if plots is not None:
+        plots = os.path.abspath(plots)
+        os.makedirs(plots, exist_ok=True)
+
+    with concurrent.futures.ProcessPoolExecutor(args.jobs) as pool:
+        jobs = [pool.submit(summarize, path, args.start, args.tol,
+                            plots, args.cache, args.md) for path in files]
+        rows = []
+        for path, job in zip(files, jobs):
+            try:
+                rows.append(job.result())
+            except Exception as error:
+                # Malformed outputs and a broken pool fail their files
+                # only, the other jobs are still collected.
+                print(' %s: %s: %s' % (path, type(error).__name__, error),
+                      file=sys.stderr)
+                rows.append(_row(path, 'failed'))
+
+    text = table(rows)
+    if args.summary:
+        with open(args.summary, 'w') as f:
+            f.write(text)
+    else:
+        sys.stdout.write(text)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
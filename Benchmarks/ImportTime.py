@@ -0,0 +1,100 @@
+#!/usr/bin/python
+
+# Import-time benchmark of Physcon.
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+import types
+
+# ----------------------------------------------------------------------
+
+#
+#     Purpose: Measure the cost of importing Physcon, optionally against
+#              the Physcon.py of another git revision.
+#
+#     For every source three timings are reported (median of --repeat
+#     runs, in microseconds):
+#
+#     exec    : Execution of the precompiled module, i.e. an import with
+#               a warm __pycache__.
+#     cold    : Compilation plus execution, i.e. an import without
+#               bytecode cache.
+#     access  : exec plus first access of every public name, which
+#               evaluates all lazily derived quantities.
+#
+#     Usage: python Benchmarks/ImportTime.py [--rev REV] [--repeat N]
+#
+#     ------------------------------------------------------------------
+#
+TOPDIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def load_source(rev=None):
+    """Source of Physcon.py in the working tree or at git revision rev."""
+    if rev is None:
+        with open(os.path.join(TOPDIR, 'Physcon.py')) as f:
+            return f.read()
+    return subprocess.run(['git', 'show', '%s:Physcon.py' % rev],
+                          cwd=TOPDIR, check=True, capture_output=True,
+                          text=True).stdout
+
+
+def _run(code, access):
+    module = types.ModuleType('Physcon')
+    module.__file__ = 'Physcon.py'
+    exec(code, module.__dict__)
+    if access:
+        for name in getattr(module, '__all__', dir(module)):
+            getattr(module, name)
+
+
+def measure(source, repeat):
+    """Median exec, cold and access times of source in microseconds."""
+    code = compile(source, 'Physcon.py', 'exec')
+    timings = {'exec': [], 'cold': [], 'access': []}
+    for _ in range(repeat):
+        start = time.perf_counter()
+        _run(code, False)
+        timings['exec'].append(time.perf_counter() - start)
+        start = time.perf_counter()
+        _run(compile(source, 'Physcon.py', 'exec'), False)
+        timings['cold'].append(time.perf_counter() - start)
+        start = time.perf_counter()
+        _run(code, True)
+        timings['access'].append(time.perf_counter() - start)
+    return {key: 1.0E6*statistics.median(values)
+            for key, values in timings.items()}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Import-time benchmark of Physcon.')
+    parser.add_argument('--rev', help='git revision to compare against')
+    parser.add_argument('--repeat', type=int, default=200,
+                        help='number of timed imports (default 200)')
+    args = parser.parse_args(argv)
+
+    sources = [('working tree', load_source())]
+    if args.rev:
+        sources.insert(0, (args.rev, load_source(args.rev)))
+
+    print(' %-16s %12s %12s %12s' % ('Physcon', 'exec [us]', 'cold [us]',
+                                     'access [us]'))
+    results = []
+    for label, source in sources:
+        result = measure(source, args.repeat)
+        results.append(result)
+        print(' %-16s %12.1f %12.1f %12.1f'
+              % (label, result['exec'], result['cold'], result['access']))
+    if len(results) == 2:
+        print(' %-16s %11.1fx %11.1fx %11.1fx'
+              % ('speedup', *(results[0][key]/results[1][key]
+                              for key in ('exec', 'cold', 'access'))))
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,153 @@
+#!/usr/bin/python
+
+# Performance benchmark suite of the deMon-Tools modules.
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+import numpy
+
+TOPDIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, TOPDIR)
+
+import Elements
+import ImportTime
+import Parser
+import Physcon
+import Synthetic
+import Units
+
+# ----------------------------------------------------------------------
+
+#
+#     Purpose: Timings of the hot paths of the tools on plain Linux,
+#              to catch performance regressions:
+#
+#              import  : Import of Physcon (see ImportTime.py).
+#              lookup  : Per-atom property lookup of a large system, with
+#                        the Physcon lists and with Elements.TABLE.
+#              convert : Bulk unit conversion with Units.convert.
+#              parse   : Parser throughput on synthetic OPT, NVE, NVT and
+#                        NPT outputs (see Synthetic.py) of several sizes.
+#
+#     ******************************************************************
+#
+#     List of variables:
+#
+#     BENCHMARKS: Benchmark names and functions.
+#
+#     Every benchmark reports the median of --repeat runs.
+#
+#     Usage: python Benchmarks/Suite.py [NAME ...] [--repeat N]
+#                   [--atoms N] [--values N] [--mb SIZE ...]
+#
+#     ------------------------------------------------------------------
+#
+def _median(function, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def bench_import(args):
+    result = ImportTime.measure(ImportTime.load_source(), args.repeat)
+    for key in ('exec', 'cold', 'access'):
+        yield 'Physcon %s' % key, '%10.1f us' % result[key]
+
+
+def bench_lookup(args):
+    rng = numpy.random.default_rng(0)
+    z = rng.integers(1, 87, args.atoms).astype(numpy.int16)
+    zlist = z.tolist()
+    covrad = Physcon.COVRAD
+    stdmatom = Physcon.STDMATOM
+
+    def lists():
+        return ([covrad[k] for k in zlist], [stdmatom[k] for k in zlist])
+
+    def table():
+        return Elements.TABLE.get(z, 'covrad', 'stdmatom')
+
+    symbols = numpy.array(Physcon.ELSYM)[z]
+    for label, function in (('Physcon lists', lists),
+                            ('Elements.TABLE', table),
+                            ('atomic_numbers',
+                             lambda: Elements.atomic_numbers(symbols))):
+        seconds = _median(function, args.repeat)
+        yield label, '%10.2f Matom/s' % (args.atoms/seconds/1.0E6)
+
+
+def bench_convert(args):
+    values = numpy.random.default_rng(0).normal(size=args.values)
+    out = numpy.empty_like(values)
+    for source, target in (('hartree', 'kcal/mol'), ('angstrom', 'bohr'),
+                           ('fs', 'au_time')):
+        seconds = _median(lambda: Units.convert(values, source, target,
+                                                out=out), args.repeat)
+        yield ('%s -> %s' % (source, target),
+               '%10.1f MB/s' % (values.nbytes/seconds/1.0E6))
+
+
+def bench_parse(args):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for mb in args.mb:
+            for kind in Synthetic.KINDS:
+                path = os.path.join(tmpdir, '%s.out' % kind.lower())
+                steps = Synthetic.steps_for(kind, mb)
+                size = Synthetic.generate(path, kind, steps)
+                kinds = (('energy', 'rms', 'max') if kind == 'OPT'
+                         else ('md',))
+                # Every step has to be found, or the rate means nothing.
+                stream = Parser.Stream(path, kinds)
+                list(stream.read(final=True))
+                for name in kinds:
+                    if stream.counts[name] != steps:
+                        raise RuntimeError('%s %g MB: parsed %d %s records '
+                                           'of %d steps'
+                                           % (kind, mb, stream.counts[name],
+                                              name, steps))
+                seconds = _median(lambda: list(Parser.records(path, kinds)),
+                                  args.repeat)
+                yield ('%s %g MB' % (kind, mb),
+                       '%10.1f MB/s' % (size/seconds/1.0E6))
+
+
+BENCHMARKS = {'import': bench_import, 'lookup': bench_lookup,
+              'convert': bench_convert, 'parse': bench_parse}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Performance benchmarks of deMon-Tools.')
+    parser.add_argument('names', nargs='*', metavar='NAME',
+                        help='benchmarks to run: %s (default all)'
+                        % ', '.join(BENCHMARKS))
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='number of timed runs (default 5)')
+    parser.add_argument('--atoms', type=int, default=1000000,
+                        help='atoms of the lookup benchmark (default 1e6)')
+    parser.add_argument('--values', type=int, default=10000000,
+                        help='values of the conversion benchmark '
+                        '(default 1e7)')
+    parser.add_argument('--mb', type=float, nargs='+', default=[1.0, 16.0],
+                        help='synthetic output sizes in MB (default 1 16)')
+    args = parser.parse_args(argv)
+    unknown = set(args.names) - set(BENCHMARKS)
+    if unknown:
+        parser.error('unknown benchmarks: %s' % ', '.join(sorted(unknown)))
+
+    for name in args.names or BENCHMARKS:
+        print(' %s' % name)
+        for label, result in BENCHMARKS[name](args):
+            print('   %-28s %s' % (label, result))
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,166 @@
+#!/usr/bin/python
+
+# Generator of synthetic deMon2k output files for the benchmarks.
+
+import argparse
+import sys
+
+import numpy
+
+# ----------------------------------------------------------------------
+
+#
+#     Purpose: Write deMon2k style OPT, NVE, NVT or NPT output files of
+#              configurable size, with the lines read by Parser.py
+#              between blocks of filler text and, optionally, the
+#              geometry of every step, so parsing throughput can be
+#              measured without real calculations.
+#
+#     ******************************************************************
+#
+#     List of variables:
+#
+#     FILLER  : Filler lines written before every record block, similar
+#               to the SCF and timing output of a deMon2k step.
+#     GEOMETRY: Header and column titles of a geometry block, read by
+#               Geometry.py.
+#     KINDS   : Supported output types.
+#     ROWS    : MD table rows per table header.
+#
+#     Usage: python Benchmarks/Synthetic.py KIND OUTPUT
+#                   [--steps N | --mb SIZE] [--filler N] [--atoms N]
+#                   [--seed N]
+#
+#     ------------------------------------------------------------------
+#
+KINDS = ('OPT', 'NVE', 'NVT', 'NPT')
+
+ROWS = 10
+
+FILLER = (' SCF ENERGY CONVERGED AFTER  14 CYCLES',
+          ' ELECTRONIC STRUCTURE ANALYSIS',
+          ' CPU TIME FOR THIS STEP IN SECONDS:      1.234',
+          ' ' + 60*'-')
+
+GEOMETRY = (' MOLECULAR ORIENTATION IN ANGSTROM\n\n'
+            '  ATOM          X              Y              Z\n')
+#
+#     ------------------------------------------------------------------
+#
+def _filler(rng, steps, filler, atoms):
+    """Filler text of every step, with a geometry of atoms water
+    molecules when atoms > 0."""
+    head = '\n'.join(FILLER[k % len(FILLER)] for k in range(filler))
+    if atoms <= 0:
+        while True:
+            yield head
+    labels = numpy.array(['O', 'H', 'H']*(atoms//3 + 1))[:atoms]
+    coords = rng.uniform(0.0, 2.0*atoms**(1.0/3.0), (atoms, 3))
+    for _ in range(steps):
+        coords += rng.normal(0.0, 0.01, coords.shape)
+        yield head + '\n' + GEOMETRY + ''.join(
+            '%4d %-4s%15.8f%15.8f%15.8f\n' % (k + 1, label, *xyz)
+            for k, (label, xyz) in enumerate(zip(labels.tolist(),
+                                                 coords.tolist())))
+
+
+def _opt_block(rng, steps, filler, atoms=0):
+    energy = -76.4 + 0.1*numpy.exp(-0.01*numpy.arange(steps))
+    rms = 0.01*numpy.exp(-0.005*numpy.arange(steps))*rng.uniform(0.5, 1.5,
+                                                                  steps)
+    heads = _filler(rng, steps, filler, atoms)
+    for e, r, head in zip(energy.tolist(), rms.tolist(), heads):
+        yield ('%s\n TOTAL ENERGY                =   %16.9f a.u.\n'
+               ' RMSQ FORCE                  =   %12.6f\n'
+               ' MAX FORCE                   =   %12.6f\n'
+               % (head, e, r, 2.0*r))
+
+
+def _md_block(rng, steps, filler, kind, atoms=0):
+    time = 0.5*numpy.arange(steps)
+    temp = 300.0 + rng.normal(0.0, 5.0, steps)
+    ekin = 0.01 + rng.normal(0.0, 1.0E-4, steps)
+    epot = -76.4 + rng.normal(0.0, 1.0E-4, steps)
+    esys = ekin + epot
+    if kind == 'NPT':
+        columns = (time, temp, rng.normal(1.0, 50.0, steps), ekin, epot,
+                   esys)
+        header = ' TIME        TEMP        PRES       E_KIN          E_POT' \
+                 '          E_SYS'
+        row = '%12.4f%11.4f%11.4f%15.8f%15.8f%15.8f'
+    else:
+        columns = (time, temp, ekin, epot, esys)
+        header = ' TIME        TEMP        E_KIN          E_POT          E_SYS'
+        row = '%12.4f%11.4f%15.8f%15.8f%15.8f'
+    table = numpy.column_stack(columns)
+    if atoms > 0:
+        # One geometry and table row per step.
+        heads = _filler(rng, steps, filler, atoms)
+        for values, head in zip(table.tolist(), heads):
+            yield '%s\n\n%s\n%s\n' % (head, header, row % tuple(values))
+        return
+    head = next(_filler(rng, steps, filler, 0))
+    for begin in range(0, steps, ROWS):
+        block = table[begin:begin + ROWS]
+        yield '%s\n\n%s\n%s\n' % (head, header, '\n'.join(
+            row % tuple(values) for values in block.tolist()))
+
+
+def generate(path, kind, steps, filler=20, seed=0, atoms=0):
+    """Write a synthetic output of type kind with steps optimization
+    cycles or MD steps, with the geometry of every step if atoms > 0;
+    returns the number of bytes written."""
+    kind = kind.upper()
+    if kind not in KINDS:
+        raise ValueError('unknown output type %r' % kind)
+    rng = numpy.random.default_rng(seed)
+    blocks = (_opt_block(rng, steps, filler, atoms) if kind == 'OPT'
+              else _md_block(rng, steps, filler, kind, atoms))
+    size = 0
+    with open(path, 'w') as f:
+        f.write(' deMon2k synthetic %s output\n' % kind)
+        for block in blocks:
+            size += f.write(block)
+    return size
+
+
+def steps_for(kind, mb, filler=20, atoms=0):
+    """Number of steps giving an output of about mb megabytes."""
+    probe = 100 if kind.upper() == 'OPT' else 10*ROWS
+    rng = numpy.random.default_rng(0)
+    blocks = (_opt_block(rng, probe, filler, atoms) if kind.upper() == 'OPT'
+              else _md_block(rng, probe, filler, kind.upper(), atoms))
+    size = sum(len(block) for block in blocks)
+    return max(1, int(mb*1.0E6*probe/size))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Write a synthetic deMon2k output file.')
+    parser.add_argument('kind', choices=KINDS, type=str.upper,
+                        help='output type')
+    parser.add_argument('output', help='output file name')
+    size = parser.add_mutually_exclusive_group()
+    size.add_argument('--steps', type=int, default=1000,
+                      help='optimization cycles or MD steps (default 1000)')
+    size.add_argument('--mb', type=float,
+                      help='approximate file size in megabytes')
+    parser.add_argument('--filler', type=int, default=20,
+                        help='filler lines per record block (default 20)')
+    parser.add_argument('--atoms', type=int, default=0,
+                        help='atoms of the geometry written every step '
+                        '(default 0, no geometries)')
+    parser.add_argument('--seed', type=int, default=0,
+                        help='random seed (default 0)')
+    args = parser.parse_args(argv)
+
+    steps = args.steps
+    if args.mb is not None:
+        steps = steps_for(args.kind, args.mb, args.filler, args.atoms)
+    size = generate(args.output, args.kind, steps, args.filler, args.seed,
+                    args.atoms)
+    print(' %s: %d steps, %.2f MB' % (args.output, steps, size/1.0E6))
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,55 @@
+#!/usr/bin/python
+
+# Covalent bond perception from the COVRAD radii.
+
+import collections
+
+import numpy
+
+import Elements
+import Neighbors
+
+# ----------------------------------------------------------------------
+
+#
+#     Purpose: Connectivity of large systems in linear time. Two atoms
+#              are bonded when their distance does not exceed the sum
+#              of their covalent radii (Physcon.COVRAD) times a
+#              tolerance factor.
+#
+#     ******************************************************************
+#
+#     List of variables:
+#
+#     TOLERANCE: Default tolerance factor on the radii sums.
+#
+#     Coordinates are in Bohr, like COVRAD. The neighbor search cutoff
+#     is twice the largest COVRAD among the elements present times the
+#     tolerance; elements without a COVRAD entry (Z > 107) and the dummy
+#     atom X form no bonds.
+#
+#     ------------------------------------------------------------------
+#
+TOLERANCE = 1.2
+
+Bonds = collections.namedtuple('Bonds', 'indptr indices i j length')
+#
+#     ------------------------------------------------------------------
+#
+def bonds(coords, z, tolerance=TOLERANCE):
+    """Covalent bonds of the atoms with coordinates coords [Bohr] and
+    atomic numbers z.
+
+    Returns Bonds with the symmetric CSR adjacency (indptr, indices),
+    the bonded pairs i < j and their lengths.
+    """
+    coords = numpy.asarray(coords, dtype=numpy.float64)
+    radius = Elements.TABLE.get(z, 'covrad')
+    radius = numpy.where(numpy.isnan(radius), 0.0, radius)
+    cutoff = 2.0*tolerance*radius.max(initial=0.0)
+    i, j, d = Neighbors.pairs(coords, cutoff)
+    keep = d <= tolerance*(radius[i] + radius[j])
+    keep &= (radius[i] > 0.0) & (radius[j] > 0.0)
+    i, j, d = i[keep], j[keep], d[keep]
+    indptr, indices = Neighbors.csr(i, j, len(coords))
+    return Bonds(indptr, indices, i, j, d)
@@ -0,0 +1,161 @@
+#!/usr/bin/python
+
+# Columnar on-disk cache of parsed deMon2k outputs.
+
+import hashlib
+import json
+import os
+
+import numpy
+
+import Parser
+
+# ----------------------------------------------------------------------
+
+#
+#     Purpose: Keep the series parsed from an output as one .npy file per
+#              column, so later runs (any -start value, any plot) load
+#              them memory mapped instead of parsing the output again.
+#
+#     ******************************************************************
+#
+#     List of variables:
+#
+#     CACHEDIR: Cache root, $DEMON_TOOLS_CACHE or
+#               ${XDG_CACHE_HOME:-~/.cache}/deMon-Tools.
+#     COLUMNS : Column names, opt_* from the optimization records and
+#               md_1 ... md_6 from the MD table fields by position.
+#     HEAD    : Number of leading bytes hashed to identify the content.
+#     VERSION : Cache layout version, bumped when COLUMNS change.
+#
+#     An entry lives in CACHEDIR/<sha1 of the real path and the record
+#     kinds>, so an optimization plot never scans for MD rows and vice
+#     versa. It is valid while the output has the recorded size, mtime
+#     and head hash. An output that grew with an unchanged head is taken
+#     as appended to: only the new lines are parsed and added to the
+#     columns. Any other change rebuilds the entry. Only complete lines
+#     are cached; missing or non-numeric MD table fields are NaN. Which
+#     md_* column holds which quantity depends on the ensemble and is
+#     left to the caller (Parser.FIELDS).
+#
+#     ------------------------------------------------------------------
+#
+CACHEDIR = os.environ.get('DEMON_TOOLS_CACHE') or os.path.join(
+    os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'),
+    'deMon-Tools')
+
+COLUMNS = ('opt_energy', 'opt_rms', 'opt_max') + tuple(
+    'md_%d' % (k + 1) for k in range(Parser.MDFIELDS))
+
+_OPT = {'energy': 'opt_energy', 'rms': 'opt_rms', 'max': 'opt_max'}
+
+HEAD = 1 << 20
+
+VERSION = 2
+#
+#     ------------------------------------------------------------------
+#
+def _head(path, size):
+    with open(path, 'rb') as f:
+        return hashlib.sha1(f.read(min(size, HEAD))).hexdigest()
+
+
+def _entry(path, cachedir, kinds):
+    key = hashlib.sha1(('%s\0%s' % (path, ','.join(kinds))).encode())
+    return os.path.join(cachedir or CACHEDIR, key.hexdigest())
+
+
+def _read(stream):
+    """Columns of the complete lines new in stream, converted window by
+    window."""
+    parts = {name: [] for name in COLUMNS}
+    for found in stream.windows():
+        for kind, name in _OPT.items():
+            if kind in found:
+                parts[name].append(numpy.array(found[kind],
+                                               dtype=numpy.float64))
+        steps = found.get('md')
+        if steps:
+            table = numpy.array(steps, dtype=numpy.float64).T
+            for k, column in enumerate(table):
+                parts['md_%d' % (k + 1)].append(column)
+    return {name: numpy.concatenate(part) if part else numpy.zeros(0)
+            for name, part in parts.items()}
+
+
+def parse(path, kinds=tuple(Parser.KINDS)):
+    """Columns of the output path, parsed without touching the cache."""
+    return _read(Parser.Stream(path, kinds))
+
+
+def _save(entry, meta, columns):
+    os.makedirs(entry, exist_ok=True)
+    for name, column in columns.items():
+        tmp = os.path.join(entry, '.%s.npy' % name)
+        numpy.save(tmp, column)
+        os.replace(tmp, os.path.join(entry, '%s.npy' % name))
+    tmp = os.path.join(entry, '.meta.json')
+    with open(tmp, 'w') as f:
+        json.dump(meta, f)
+    os.replace(tmp, os.path.join(entry, 'meta.json'))
+
+
+def _load(entry, mmap_mode='r'):
+    columns = {}
+    for name in COLUMNS:
+        column = os.path.join(entry, '%s.npy' % name)
+        try:
+            columns[name] = numpy.load(column, mmap_mode=mmap_mode)
+        except ValueError:
+            # Empty columns cannot be memory mapped.
+            columns[name] = numpy.load(column)
+    return columns
+
+
+def load(path, cachedir=None, kinds=tuple(Parser.KINDS)):
+    """Columns of the records kinds of the output path, from the cache
+    where possible.
+
+    Returns a dict of float64 arrays keyed by the COLUMNS names, the
+    columns of other kinds are empty. Arrays loaded from a valid entry
+    are read-only memory maps.
+    """
+    path = os.path.realpath(path)
+    stat = os.stat(path)
+    kinds = tuple(kind for kind in Parser.KINDS if kind in kinds)
+    entry = _entry(path, cachedir, kinds)
+    try:
+        with open(os.path.join(entry, 'meta.json')) as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        meta = None
+
+    stream = Parser.Stream(path, kinds)
+    old = None
+    if (meta and meta.get('version') == VERSION and meta['path'] == path
+            and stat.st_size >= meta['size']
+            and _head(path, meta['size']) == meta['head']):
+        try:
+            if (stat.st_size == meta['size']
+                    and stat.st_mtime_ns == meta['mtime_ns']):
+                return _load(entry)
+            if stat.st_size > meta['size']:
+                old = _load(entry, None)
+                stream.offset = meta['offset']
+                stream.counts.update(meta['counts'])
+        except (OSError, ValueError):
+            old = None
+            stream = Parser.Stream(path, kinds)
+
+    columns = _read(stream)
+    if old is not None:
+        columns = {name: numpy.concatenate((old[name], columns[name]))
+                   for name in COLUMNS}
+    meta = {'version': VERSION, 'path': path, 'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns, 'head': _head(path, stat.st_size),
+            'offset': stream.offset, 'counts': stream.counts}
+    try:
+        _save(entry, meta, columns)
+    except OSError:
+        pass
+    return columns
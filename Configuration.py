@@ -0,0 +1,124 @@
+#!/usr/bin/python
+
+# Electron configuration occupancies parsed once from ELCONF.
+
+import functools
+import re
+
+import numpy
+
+import Elements
+import Physcon
+
+# ----------------------------------------------------------------------
+
+#
+#     Purpose: Ground state electron configurations of Physcon.ELCONF as
+#              a (Z x subshell) occupancy array, with per element
+#              valence electron counts, open-shell flags and Hund's rule
+#              multiplicities, for array lookups over whole systems.
+#
+#     ******************************************************************
+#
+#     List of variables:
+#
+#     CORE        : Electrons in the noble gas core of the ELCONF entry.
+#     MULTIPLICITY: Atomic ground state multiplicity (Hund's rule).
+#     OCCUPANCY   : (NELEM, NSHELL) uint8 subshell occupancies.
+#     OPENSHELL   : True for atoms with a partially filled subshell.
+#     SHELLS      : Subshell labels (1s, 2s, 2p, ...) in Madelung order.
+#     UNPAIRED    : Unpaired electrons of the atomic ground state.
+#     VALENCE     : Electrons outside the noble gas core, not counting
+#                   filled d and f subshells (Cu 1, Ga 3, Fe 8, Pd 0).
+#
+#     The dummy atom X (Z = 0) has no electrons. All arrays are indexed
+#     by atomic number and read-only.
+#
+#     ------------------------------------------------------------------
+#
+SHELLS = ('1s', '2s', '2p', '3s', '3p', '4s', '3d', '4p', '5s', '4d',
+          '5p', '6s', '4f', '5d', '6p', '7s', '5f', '6d', '7p')
+
+_INDEX = {shell: k for k, shell in enumerate(SHELLS)}
+_CAPACITY = numpy.array([2*(2*'spdf'.index(shell[1]) + 1)
+                         for shell in SHELLS], dtype=numpy.uint8)
+_CORE = re.compile(r'\[(\w+)\]')
+_SHELL = re.compile(r'(\d[spdf])\^(\d+)')
+#
+#     ------------------------------------------------------------------
+#
+@functools.lru_cache(maxsize=None)
+def _expand(z):
+    """Occupancy tuple and core electrons of atomic number z, with the
+    noble gas core expanded once per core element."""
+    conf = Physcon.ELCONF[z]
+    occupancy = [0]*len(SHELLS)
+    core = 0
+    match = _CORE.match(conf)
+    if match:
+        core = Physcon.ELNUM[match.group(1).lower()]
+        occupancy = list(_expand(core)[0])
+        conf = conf[match.end():]
+    for shell, count in _SHELL.findall(conf):
+        occupancy[_INDEX[shell]] += int(count)
+    return tuple(occupancy), core
+
+
+def _tables():
+    occupancy = numpy.zeros((Elements.NELEM, len(SHELLS)), dtype=numpy.uint8)
+    core = numpy.zeros(Elements.NELEM, dtype=numpy.uint8)
+    for z in range(1, Elements.NELEM):
+        occupancy[z], core[z] = _expand(z)
+    return occupancy, core
+
+
+def _readonly(*arrays):
+    for array in arrays:
+        array.flags.writeable = False
+#
+#     ------------------------------------------------------------------
+#
+OCCUPANCY, CORE = _tables()
+
+_filled = OCCUPANCY == _CAPACITY
+_dfshell = numpy.array([shell[1] in 'df' for shell in SHELLS])
+
+UNPAIRED = numpy.minimum(OCCUPANCY, _CAPACITY - OCCUPANCY).sum(
+    axis=1, dtype=numpy.uint8)
+MULTIPLICITY = UNPAIRED + numpy.uint8(1)
+OPENSHELL = ((OCCUPANCY > 0) & ~_filled).any(axis=1)
+_outer = OCCUPANCY - OCCUPANCY[CORE]
+VALENCE = numpy.where(_filled & _dfshell, 0, _outer).sum(axis=1,
+                                                         dtype=numpy.uint8)
+_readonly(OCCUPANCY, CORE, UNPAIRED, MULTIPLICITY, OPENSHELL, VALENCE)
+
+del _filled, _dfshell, _outer
+#
+#     ------------------------------------------------------------------
+#
+def occupancy(z):
+    """Subshell occupancies (..., NSHELL) of atomic number(s) z."""
+    return OCCUPANCY[Elements.TABLE._index(z)]
+
+
+def electrons(z, charge=0):
+    """Number of electrons of the system(s) with atomic numbers z along
+    the last axis and total charge charge."""
+    z = Elements.TABLE._index(z)
+    return numpy.sum(z, axis=-1, dtype=numpy.int64) - charge
+
+
+def valence_electrons(z, charge=0):
+    """Number of valence electrons (see VALENCE) of the system(s) z."""
+    return (numpy.sum(VALENCE[Elements.TABLE._index(z)], axis=-1,
+                      dtype=numpy.int64) - charge)
+
+
+def multiplicity(z, charge=0):
+    """Default multiplicity of the system(s) z: singlet for an even and
+    doublet for an odd number of electrons. Isolated atoms get their
+    Hund's rule multiplicity from MULTIPLICITY instead."""
+    n = electrons(z, charge)
+    if numpy.any(n < 0):
+        raise ValueError('charge exceeds the number of electrons')
+    return 1 + n % 2
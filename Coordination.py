@@ -0,0 +1,91 @@
+#!/usr/bin/python
+
+# D3 coordination numbers from the D3CR radii.
+
+import concurrent.futures
+
+import numpy
+
+import Elements
+import Neighbors
+
+# ----------------------------------------------------------------------
+
+#
+#     Purpose: Fractional coordination numbers of the D3 dispersion
+#              correction for many frames at once,
+#
+#              CN_i = sum_j 1/(1 + exp(-K1*(K2*(R_i + R_j)/r_ij - 1)))
+#
+#              with R the Pyykko covalent radii of Physcon.D3CR.
+#
+#     Lit.: S. Grimme et al., J. Chem. Phys. 132, 154104 (2010)
+#
+#     ******************************************************************
+#
+#     List of variables:
+#
+#     CUTOFF  : Default neighbor cutoff [Bohr], the CN threshold of the
+#               dftd3 program (1600 Bohr**2).
+#     K1      : Steepness of the counting function.
+#     K2      : Scaling of the covalent radii.
+#
+#     Coordinates are in Bohr. Pairs beyond the cutoff are skipped
+#     through the neighbor list. The counting function does not vanish
+#     at large distances but tends to 1/(1 + exp(K1)) = 1.1E-7, so every
+#     skipped pair changes CN by at least that much: at 40 Bohr a pair
+#     still counts about 8E-6 for the largest D3CR radii and 5E-7 for
+#     C-C (1E-4 and 1E-6 at 25 Bohr). The truncation error of an atom
+#     is this times its number of neighbors beyond the cutoff.
+#
+#     ------------------------------------------------------------------
+#
+CUTOFF = 40.0
+
+K1 = 16.0
+K2 = 4.0/3.0
+#
+#     ------------------------------------------------------------------
+#
+def _frame(coords, radius, cutoff, chunk):
+    natom = len(coords)
+    cn = numpy.zeros(natom)
+    # Each block of pairs is counted and dropped before the next one.
+    for i, j, d in Neighbors.chunks(coords, cutoff, chunk):
+        count = 1.0/(1.0 + numpy.exp(-K1*(K2*(radius[i] + radius[j])/d
+                                          - 1.0)))
+        cn += numpy.bincount(i, count, natom)
+        cn += numpy.bincount(j, count, natom)
+    return cn
+
+
+def _frames(frames, radius, cutoff, chunk):
+    return numpy.array([_frame(coords, radius, cutoff, chunk)
+                        for coords in frames]).reshape(len(frames), -1)
+
+
+def coordination_numbers(coords, z, cutoff=CUTOFF,
+                         chunk=Neighbors.CHUNK, processes=None):
+    """D3 coordination numbers of one frame (natom, 3) or of a stack of
+    frames (nframe, natom, 3) sharing the atomic numbers z.
+
+    chunk bounds the number of atoms whose pairs are handled at once;
+    processes > 1 distributes blocks of frames over a process pool.
+    Returns an array of shape (natom,) or (nframe, natom).
+    """
+    coords = numpy.asarray(coords, dtype=numpy.float64)
+    radius = Elements.TABLE.get(z, 'd3cr')
+    single = coords.ndim == 2
+    frames = coords[numpy.newaxis] if single else coords
+    if frames.shape[1:] != (len(radius), 3):
+        raise ValueError('coordinates of shape %s do not match %d atoms'
+                         % (coords.shape, len(radius)))
+    if not processes or processes < 2 or len(frames) < 2:
+        cn = _frames(frames, radius, cutoff, chunk)
+    else:
+        blocks = numpy.array_split(frames, min(processes, len(frames)))
+        with concurrent.futures.ProcessPoolExecutor(processes) as pool:
+            cn = numpy.concatenate(list(pool.map(
+                _frames, blocks, [radius]*len(blocks),
+                [cutoff]*len(blocks), [chunk]*len(blocks))))
+    return cn[0] if single else cn
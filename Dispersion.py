@@ -0,0 +1,140 @@
+#!/usr/bin/python
+
+# Pairwise C6 dispersion energy and gradient from the CSIX coefficients.
+
+import concurrent.futures
+
+import numpy
+
+import Elements
+import Neighbors
+
+# ----------------------------------------------------------------------
+
+#
+#     Purpose: Empirical dispersion correction
+#
+#              E = -S6 * sum_i<j f(r_ij) * C6_ij/r_ij**6
+#
+#              and its Cartesian gradient, vectorized over the pairs of
+#              a neighbor list, for one frame or many frames.
+#
+#     Lit.: Q. Wu, W. Yang, J. Chem. Phys. 116, 515 (2002)
+#           S. Grimme, J. Comput. Chem. 27, 1787 (2006)
+#
+#     ******************************************************************
+#
+#     List of variables:
+#
+#     CUTOFF  : Default pair cutoff [Bohr].
+#     DAMPING : Damping functions f(r, R0) and their derivatives, with
+#               R0 the sum of the van der Waals radii (Physcon.VDWRAD):
+#               None  : f = 1, undamped.
+#               'wy'  : f = (1 - exp(-3.54*(r/R0)**3))**2 (Wu-Yang).
+#               'fermi': f = 1/(1 + exp(-20*(r/R0 - 1))) (Grimme D2).
+#
+#     The pair coefficients follow the Wu-Yang combination rule
+#     C6_ij = 2*C6_i*C6_j/(C6_i + C6_j), precomputed once as a matrix
+#     over the elements present. Coordinates are in Bohr, energies in
+#     Hartree and gradients in Hartree/Bohr.
+#
+#     ------------------------------------------------------------------
+#
+CUTOFF = 30.0
+
+
+def _undamped(r, r0):
+    return numpy.ones_like(r), numpy.zeros_like(r)
+
+
+def _wu_yang(r, r0, d=3.54):
+    e = numpy.exp(-d*(r/r0)**3)
+    g = 1.0 - e
+    return g*g, 6.0*d*g*e*r*r/r0**3
+
+
+def _fermi(r, r0, d=20.0):
+    e = numpy.exp(-d*(r/r0 - 1.0))
+    f = 1.0/(1.0 + e)
+    return f, d/r0*e*f*f
+
+
+DAMPING = {None: _undamped, 'wy': _wu_yang, 'fermi': _fermi}
+#
+#     ------------------------------------------------------------------
+#
+def c6_matrix(z):
+    """Combined C6 matrix over the distinct elements of z.
+
+    Returns the matrix and the index of every atom into it.
+    """
+    elements, index = numpy.unique(numpy.asarray(z), return_inverse=True)
+    c6 = Elements.TABLE.get(elements, 'csix')
+    total = c6[:, numpy.newaxis] + c6
+    with numpy.errstate(invalid='ignore', divide='ignore'):
+        matrix = numpy.where(total > 0.0, 2.0*numpy.outer(c6, c6)/total, 0.0)
+    return matrix, index.ravel()
+
+
+class Dispersion:
+    """Dispersion model of a fixed set of atoms.
+
+    The C6 matrix and the van der Waals radii are set up once and reused
+    for every frame passed to energy() or batch().
+    """
+
+    def __init__(self, z, damping='wy', s6=1.0, cutoff=CUTOFF,
+                 chunk=Neighbors.CHUNK):
+        if damping not in DAMPING:
+            raise ValueError('unknown damping %r' % damping)
+        self.z = numpy.asarray(z)
+        self.c6, self.index = c6_matrix(self.z)
+        self.vdwrad = Elements.TABLE.get(self.z, 'vdwrad')
+        self.damping = DAMPING[damping]
+        self.s6 = s6
+        self.cutoff = cutoff
+        self.chunk = chunk
+
+    def energy(self, coords, gradient=True):
+        """Energy and (natom, 3) gradient of one frame."""
+        coords = numpy.asarray(coords, dtype=numpy.float64)
+        natom = len(coords)
+        energy = 0.0
+        grad = numpy.zeros((natom, 3)) if gradient else None
+        # Each block of pairs is reduced and dropped before the next one.
+        for i, j, r in Neighbors.chunks(coords, self.cutoff, self.chunk):
+            c6 = self.c6[self.index[i], self.index[j]]
+            f, df = self.damping(r, self.vdwrad[i] + self.vdwrad[j])
+            r6 = r**6
+            energy -= self.s6*numpy.sum(f*c6/r6)
+            if not gradient:
+                continue
+            # dE/dr per pair, projected onto the pair vectors.
+            dedr = -self.s6*c6*(df - 6.0*f/r)/r6
+            vector = (coords[i] - coords[j])*(dedr/r)[:, numpy.newaxis]
+            for k in range(3):
+                grad[:, k] += (numpy.bincount(i, vector[:, k], natom)
+                               - numpy.bincount(j, vector[:, k], natom))
+        return energy, grad
+
+    def batch(self, frames, gradient=True, threads=None):
+        """Energies (nframe,) and gradients (nframe, natom, 3) of a stack
+        of frames, on a thread pool when threads > 1. The NumPy kernels
+        release the GIL, so the threads run concurrently."""
+        frames = numpy.asarray(frames, dtype=numpy.float64)
+        if threads and threads > 1:
+            with concurrent.futures.ThreadPoolExecutor(threads) as pool:
+                results = list(pool.map(lambda coords:
+                                        self.energy(coords, gradient),
+                                        frames))
+        else:
+            results = [self.energy(coords, gradient) for coords in frames]
+        energies = numpy.array([energy for energy, _ in results])
+        if not gradient:
+            return energies, None
+        return energies, numpy.array([grad for _, grad in results])
+
+
+def dispersion(coords, z, damping='wy', s6=1.0, cutoff=CUTOFF):
+    """Energy and gradient of one frame, see Dispersion."""
+    return Dispersion(z, damping, s6, cutoff).energy(coords)
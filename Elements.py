@@ -0,0 +1,153 @@
+#!/usr/bin/python
+
+# Array-backed periodic table built on the element lists of Physcon.
+
+import numpy
+
+import Physcon
+
+# ----------------------------------------------------------------------
+
+#
+#     Purpose: Element properties as contiguous arrays sharing one
+#              atomic number index, so per-atom properties of a whole
+#              system are obtained with one fancy-indexing call.
+#
+#     ******************************************************************
+#
+#     List of variables:
+#
+#     FIELDS  : Names of the table columns, their source lists and the
+#               atomic number of the first entry of each list.
+#     NELEM   : Number of table entries (Z = 0 is the dummy atom X).
+#     TABLE   : Element table of the Physcon lists.
+#
+#     atomic_number() and atomic_numbers() resolve element symbols
+#     through the hashed, case insensitive Physcon.ELNUM index.
+#
+#     TABLE is rebuilt (radii in Bohr) when another CODATA release is
+#     selected with Physcon.set_codata().
+#
+#     Entries missing in a source list (COVRAD and VDWRAD end at Z = 107,
+#     R2R4 starts at H and ends at Z = 94) are stored as NaN. Numeric
+#     lists starting at Z = 0 must hold the 0.0 placeholder of X there.
+#
+#     ------------------------------------------------------------------
+#
+FIELDS = (('covrad',   'COVRAD',   numpy.float64, 0),
+          ('d3cr',     'D3CR',     numpy.float64, 0),
+          ('vdwrad',   'VDWRAD',   numpy.float64, 0),
+          ('csix',     'CSIX',     numpy.float64, 0),
+          ('r2r4',     'R2R4',     numpy.float64, 1),
+          ('stdmatom', 'STDMATOM', numpy.float64, 0),
+          ('elgrp',    'ELGRP',    'U5',          0),
+          ('elsym',    'ELSYM',    'U2',          0))
+
+NELEM = len(Physcon.ELSYM)
+#
+#     ------------------------------------------------------------------
+#
+class ElementTable:
+    """Element properties indexed by atomic number.
+
+    Every field of FIELDS is available as a read-only contiguous array
+    attribute (table.covrad, table.stdmatom, ...), and as a column of
+    the structured array table.records.
+    """
+
+    def __init__(self):
+        self.records = numpy.zeros(NELEM, dtype=[(name, dtype)
+                                   for name, _, dtype, _ in FIELDS])
+        for name, source, dtype, first in FIELDS:
+            values = getattr(Physcon, source)
+            column = numpy.full(NELEM, numpy.nan if dtype is numpy.float64
+                                else '', dtype=dtype)
+            if dtype is numpy.float64:
+                if first == 0 and values[0] != 0.0:
+                    raise ValueError('Physcon.%s has no Z = 0 placeholder'
+                                     % source)
+                column[first:first + len(values)] = values
+            else:
+                column[first:first + len(values)] = [value.strip()
+                                                     for value in values]
+            column.flags.writeable = False
+            setattr(self, name, column)
+            self.records[name] = column
+        self.records.flags.writeable = False
+
+    def __len__(self):
+        return NELEM
+
+    def __getitem__(self, z):
+        """Structured records for atomic number(s) z."""
+        return self.records[self._index(z)]
+
+    def get(self, z, *names):
+        """Columns names for atomic number(s) z.
+
+        A single name returns one array, several names return a tuple
+        of arrays in the order requested.
+        """
+        z = self._index(z)
+        if not names:
+            raise TypeError('get() requires at least one field name')
+        columns = tuple(getattr(self, name)[z] for name in names)
+        return columns[0] if len(columns) == 1 else columns
+
+    def _index(self, z):
+        z = numpy.asarray(z)
+        if z.dtype.kind not in 'iu':
+            raise TypeError('atomic numbers must be integers, got %s'
+                            % z.dtype)
+        if z.size and (z.min() < 0 or z.max() >= NELEM):
+            raise IndexError('atomic numbers must lie in [0, %d]'
+                             % (NELEM - 1))
+        return z
+#
+#     ------------------------------------------------------------------
+#
+TABLE = ElementTable()
+
+
+@Physcon.on_codata
+def _reset():
+    global TABLE
+    TABLE = ElementTable()
+#
+#     ------------------------------------------------------------------
+#
+def atomic_number(symbol):
+    """Atomic number of one element symbol (case insensitive)."""
+    if isinstance(symbol, bytes):
+        symbol = symbol.decode()
+    try:
+        return Physcon.ELNUM[symbol.strip().lower()]
+    except KeyError:
+        raise KeyError('unknown element symbol %r' % symbol) from None
+
+
+def atomic_numbers(symbols):
+    """int16 array of atomic numbers for a sequence of element symbols.
+
+    Each distinct symbol is resolved once. All unknown symbols are
+    reported together in a single KeyError.
+    """
+    symbols = numpy.asarray(symbols)
+    if symbols.size == 0:
+        return numpy.zeros(symbols.shape, dtype=numpy.int16)
+    unique, inverse = numpy.unique(symbols, return_inverse=True)
+    if unique.dtype.kind == 'S':
+        unique = numpy.char.decode(unique)
+    elnum = Physcon.ELNUM
+    lut = numpy.empty(len(unique), dtype=numpy.int16)
+    unknown = []
+    for i, symbol in enumerate(unique.tolist()):
+        z = elnum.get(symbol.strip().lower())
+        if z is None:
+            unknown.append(symbol)
+        else:
+            lut[i] = z
+    if unknown:
+        raise KeyError('unknown element symbols: %s'
+                       % ', '.join(repr(symbol) for symbol in unknown))
+    return lut[inverse].reshape(symbols.shape)
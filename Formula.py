@@ -0,0 +1,159 @@
+#!/usr/bin/python
+
+# Chemical formula parser and molar masses from STDMATOM.
+
+import functools
+import re
+
+import numpy
+
+import Elements
+import Physcon
+
+# ----------------------------------------------------------------------
+
+#
+#     Purpose: Element count vectors of chemical formulas with nested
+#              brackets and hydrates (CuSO4*5H2O, CuSO4.5H2O or with a
+#              middle dot), and molar masses from the standard atomic
+#              masses (Physcon.STDMATOM) in amu, kg or atomic units.
+#
+#     ******************************************************************
+#
+#     List of variables:
+#
+#     CACHE   : Number of parsed formulas kept in the LRU cache.
+#     CHUNK   : Formulas per block of the bulk count matrix.
+#     MASSUNIT: Conversion factors [amu] -> [unit] (Physcon.AMUKG and
+#               Physcon.AMU).
+#
+#     Element symbols are case sensitive (Co is cobalt, CO carbon
+#     monoxide) and counts are positive integers. Empty formulas, parts
+#     or brackets, zero counts and the dummy atom X raise ValueError.
+#
+#     ------------------------------------------------------------------
+#
+CACHE = 1 << 16
+CHUNK = 1 << 16
+
+MASSUNIT = {'amu': 1.0, 'kg': Physcon.AMUKG, 'au': Physcon.AMU}
+
+_TOKEN = re.compile(r'\s*(?:([A-Z][a-z]?)|(\d+)|([(\[{])|([)\]}])'
+                    r'|([.*·]))')
+_CLOSE = {'(': ')', '[': ']', '{': '}'}
+#
+#     ------------------------------------------------------------------
+#
+def _tokens(formula):
+    pos = 0
+    end = len(formula.rstrip())
+    while pos < end:
+        match = _TOKEN.match(formula, pos)
+        if match is None:
+            raise ValueError('invalid formula %r at position %d'
+                             % (formula, pos))
+        yield match.lastindex, match.group(match.lastindex)
+        pos = match.end()
+
+
+def _group(tokens, formula, close=None):
+    counts = numpy.zeros(Elements.NELEM, dtype=numpy.int64)
+    last = None
+    for kind, text in tokens:
+        if kind == 1:
+            z = Physcon.ELNUM.get(text.lower())
+            if not z or Physcon.ELSYM[z].strip() != text:
+                raise ValueError('unknown element %r in formula %r'
+                                 % (text, formula))
+            last = numpy.zeros_like(counts)
+            last[z] = 1
+            counts += last
+        elif kind == 2:
+            if last is None:
+                raise ValueError('misplaced count in formula %r' % formula)
+            if int(text) == 0:
+                raise ValueError('zero count in formula %r' % formula)
+            counts += (int(text) - 1)*last
+            last = None
+        elif kind == 3:
+            last = _group(tokens, formula, _CLOSE[text])
+            counts += last
+        else:
+            if text != close:
+                raise ValueError('unbalanced %r in formula %r'
+                                 % (text, formula))
+            if not counts.any():
+                raise ValueError('empty brackets in formula %r' % formula)
+            return counts
+    if close is not None:
+        raise ValueError('missing %r in formula %r' % (close, formula))
+    return counts
+
+
+def _parts(tokens, formula):
+    """Token lists of the hydrate parts of formula."""
+    parts = [[]]
+    depth = 0
+    for kind, text in tokens:
+        if kind == 5:
+            if depth:
+                raise ValueError('hydrate separator inside brackets in '
+                                 'formula %r' % formula)
+            parts.append([])
+            continue
+        depth += {3: 1, 4: -1}.get(kind, 0)
+        parts[-1].append((kind, text))
+    return parts
+
+
+@functools.lru_cache(maxsize=CACHE)
+def parse(formula):
+    """Element count vector (read-only, indexed by atomic number) of
+    formula."""
+    counts = numpy.zeros(Elements.NELEM, dtype=numpy.int64)
+    for k, part in enumerate(_parts(_tokens(formula), formula)):
+        # Every hydrate part is parsed once, with its own multiplier.
+        factor = 1
+        if k and part and part[0][0] == 2:
+            factor = int(part[0][1])
+            part = part[1:]
+        if factor == 0:
+            raise ValueError('zero count in formula %r' % formula)
+        if not part:
+            raise ValueError('empty formula or hydrate part in %r'
+                             % formula)
+        counts += factor*_group(iter(part), formula)
+    counts.flags.writeable = False
+    return counts
+
+
+def mass(formula, unit='amu'):
+    """Molar mass of formula in amu, kg or au."""
+    return float(parse(formula) @ Elements.TABLE.stdmatom)*MASSUNIT[unit]
+
+
+def count_matrix(formulas):
+    """(nformula, NELEM) count matrix of a sequence of formulas."""
+    return numpy.array([parse(formula) for formula in formulas],
+                       dtype=numpy.int64).reshape(-1, Elements.NELEM)
+
+
+def masses(formulas, unit='amu', chunk=CHUNK):
+    """Molar masses of many formulas in amu, kg or au.
+
+    Every distinct formula is parsed once; the masses are dot products
+    of blocks of chunk count vectors with the STDMATOM table.
+    """
+    unique, inverse = numpy.unique(numpy.asarray(formulas, dtype=str),
+                                   return_inverse=True)
+    table = Elements.TABLE.stdmatom
+    result = numpy.empty(len(unique))
+    for begin in range(0, len(unique), chunk):
+        block = unique[begin:begin + chunk].tolist()
+        result[begin:begin + len(block)] = count_matrix(block) @ table
+    return result[inverse].reshape(numpy.shape(formulas))*MASSUNIT[unit]
+
+
+@Physcon.on_codata
+def _reset():
+    MASSUNIT.update(kg=Physcon.AMUKG, au=Physcon.AMU)
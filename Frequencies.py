@@ -0,0 +1,195 @@
+#!/usr/bin/python
+
+# Harmonic frequencies and normal modes from Cartesian Hessians.
+
+import collections
+
+import numpy
+
+import Elements
+import Physcon
+
+# ----------------------------------------------------------------------
+
+#
+#     Purpose: Mass weighting of Cartesian Hessians, projection of the
+#              translations and rotations, and diagonalization of stacks
+#              of Hessians with one batched LAPACK call, giving harmonic
+#              wave numbers and normal modes. Isotopologues reuse the
+#              mass-weighted Hessian and rescale only the rows and
+#              columns of the substituted atoms.
+#
+#     ******************************************************************
+#
+#     List of variables:
+#
+#     Modes   : Result with the fields
+#               freqs: (..., nmode) wave numbers [1/cm], imaginary modes
+#                      as negative values, in ascending order.
+#               modes: (..., nmode, natom, 3) normalized Cartesian
+#                      displacements of the normal modes.
+#     TOL     : Relative singular value below which a rigid-body
+#               direction is dropped (linear molecules, atoms).
+#
+#     Hessians are in Hartree/Bohr**2 and coordinates in Bohr; masses
+#     are in amu, by default Physcon.STDMATOM of the atomic numbers. With
+#     amu masses Physcon.VIBFAC converts the square roots of the
+#     eigenvalues into wave numbers. Without projection all 3N modes
+#     are returned; with projection the 6 (5 for linear molecules)
+#     rigid-body modes are removed.
+#
+#     ------------------------------------------------------------------
+#
+Modes = collections.namedtuple('Modes', 'freqs modes')
+
+TOL = 1.0E-8
+#
+#     ------------------------------------------------------------------
+#
+def mass_weight(hessian, masses):
+    """Mass-weighted Hessian(s) M**-1/2 H M**-1/2 for masses (..., N)."""
+    scale = numpy.repeat(1.0/numpy.sqrt(numpy.asarray(masses,
+                                                      dtype=numpy.float64)),
+                         3, axis=-1)
+    return (numpy.asarray(hessian, dtype=numpy.float64)
+            *scale[..., :, numpy.newaxis]*scale[..., numpy.newaxis, :])
+
+
+def rigid_body(coords, masses):
+    """Orthonormal mass-weighted translation and rotation vectors
+    (..., 3N, 6) and their number (6, 5 or 3) per molecule."""
+    coords = numpy.asarray(coords, dtype=numpy.float64)
+    masses = numpy.asarray(masses, dtype=numpy.float64)
+    shape = numpy.broadcast_shapes(coords.shape[:-1], masses.shape)
+    coords = numpy.broadcast_to(coords, shape + (3,))
+    masses = numpy.broadcast_to(masses, shape)
+    root = numpy.sqrt(masses)[..., numpy.newaxis]
+    center = ((masses[..., numpy.newaxis]*coords).sum(axis=-2, keepdims=True)
+              /masses.sum(axis=-1)[..., numpy.newaxis, numpy.newaxis])
+    r = coords - center
+    unit = numpy.eye(3)
+    vectors = [root*numpy.broadcast_to(unit[a], r.shape) for a in range(3)]
+    vectors += [root*numpy.cross(unit[a], r) for a in range(3)]
+    d = numpy.stack([v.reshape(v.shape[:-2] + (-1,)) for v in vectors],
+                    axis=-1)
+    u, sigma, _ = numpy.linalg.svd(d, full_matrices=False)
+    keep = sigma > TOL*sigma[..., :1]
+    # Dropped directions are zeroed, so u spans the rigid-body space.
+    return u*keep[..., numpy.newaxis, :], keep.sum(axis=-1)
+
+
+def _project(hmw, d):
+    """P H P with P = 1 - D D^T, from rank-6 updates only."""
+    hd = hmw @ d
+    dhd = numpy.swapaxes(d, -1, -2) @ hd
+    dt = numpy.swapaxes(d, -1, -2)
+    return (hmw - hd @ dt - d @ numpy.swapaxes(hd, -1, -2)
+            + d @ dhd @ dt)
+
+
+def _diagonalize(hmw, masses, d=None, nrigid=None):
+    values, vectors = numpy.linalg.eigh(hmw)
+    if d is not None:
+        nrigid = numpy.atleast_1d(nrigid)
+        if (nrigid != nrigid.flat[0]).any():
+            raise ValueError('stack mixes linear and nonlinear molecules, '
+                             'diagonalize them separately')
+        # Remove the eigenvectors lying in the rigid-body space.
+        overlap = numpy.square(numpy.swapaxes(d, -1, -2) @ vectors).sum(
+            axis=-2)
+        nmode = values.shape[-1] - int(nrigid.flat[0])
+        keep = numpy.sort(numpy.argsort(overlap, axis=-1,
+                                        kind='stable')[..., :nmode], axis=-1)
+        values = numpy.take_along_axis(values, keep, axis=-1)
+        vectors = numpy.take_along_axis(vectors, keep[..., numpy.newaxis, :],
+                                        axis=-1)
+    freqs = numpy.sign(values)*numpy.sqrt(numpy.abs(values))*Physcon.VIBFAC
+    # Cartesian displacements: M**-1/2 L, normalized.
+    scale = numpy.repeat(1.0/numpy.sqrt(numpy.asarray(masses,
+                                                      dtype=numpy.float64)),
+                         3, axis=-1)
+    modes = vectors*scale[..., :, numpy.newaxis]
+    modes /= numpy.linalg.norm(modes, axis=-2, keepdims=True)
+    modes = numpy.swapaxes(modes, -1, -2)
+    return Modes(freqs, modes.reshape(modes.shape[:-1] + (-1, 3)))
+
+
+def frequencies(hessian, coords, z=None, masses=None, project=True):
+    """Modes of one Hessian (3N, 3N) or a stack (..., 3N, 3N) with the
+    coordinates (..., N, 3); masses (amu) default to STDMATOM of z."""
+    if masses is None:
+        masses = Elements.TABLE.get(z, 'stdmatom')
+    masses = numpy.broadcast_to(numpy.asarray(masses, dtype=numpy.float64),
+                                numpy.shape(coords)[:-1])
+    hmw = mass_weight(hessian, masses)
+    if not project:
+        return _diagonalize(hmw, masses)
+    d, nrigid = rigid_body(coords, masses)
+    return _diagonalize(_project(hmw, d), masses, d, nrigid)
+
+
+class Hessian:
+    """Mass-weighted Hessian of one molecule, for isotope scans.
+
+    substitute() and scan() rescale only the rows and columns of the
+    atoms whose masses change; scan() diagonalizes all isotopologues
+    with one batched call.
+    """
+
+    def __init__(self, hessian, coords, z=None, masses=None):
+        self.coords = numpy.asarray(coords, dtype=numpy.float64)
+        if masses is None:
+            masses = Elements.TABLE.get(z, 'stdmatom')
+        self.masses = numpy.array(masses, dtype=numpy.float64)
+        self.hmw = mass_weight(hessian, self.masses)
+
+    def _changes(self, changes):
+        atoms = numpy.fromiter(changes.keys(), dtype=numpy.int64,
+                               count=len(changes))
+        masses = numpy.fromiter(changes.values(), dtype=numpy.float64,
+                                count=len(changes))
+        return atoms, masses
+
+    def _rescale(self, hmw, atoms, masses):
+        """Rescale in place the rows and columns of atoms of a copy of
+        the mass-weighted Hessian for their new masses."""
+        factor = numpy.sqrt(self.masses[atoms]/masses)
+        rows = (3*atoms[:, numpy.newaxis] + numpy.arange(3)).ravel()
+        factor = numpy.repeat(factor, 3)
+        hmw[..., rows, :] *= factor[:, numpy.newaxis]
+        hmw[..., :, rows] *= factor
+        return hmw
+
+    def substitute(self, changes):
+        """Hessian of the isotopologue with the masses changes (atom
+        index -> mass [amu])."""
+        atoms, masses = self._changes(changes)
+        other = object.__new__(Hessian)
+        other.coords = self.coords
+        other.masses = self.masses.copy()
+        other.hmw = self._rescale(self.hmw.copy(), atoms, masses)
+        other.masses[atoms] = masses
+        return other
+
+    def frequencies(self, project=True):
+        """Modes of this molecule."""
+        if not project:
+            return _diagonalize(self.hmw, self.masses)
+        d, nrigid = rigid_body(self.coords, self.masses)
+        return _diagonalize(_project(self.hmw, d), self.masses, d, nrigid)
+
+    def scan(self, substitutions, project=True):
+        """Modes (nsub, ...) of the isotopologues given by a sequence of
+        changes dictionaries, diagonalized in one batched call."""
+        hmw = numpy.repeat(self.hmw[numpy.newaxis], len(substitutions),
+                           axis=0)
+        masses = numpy.repeat(self.masses[numpy.newaxis], len(substitutions),
+                              axis=0)
+        for k, changes in enumerate(substitutions):
+            atoms, new = self._changes(changes)
+            self._rescale(hmw[k], atoms, new)
+            masses[k, atoms] = new
+        if not project:
+            return _diagonalize(hmw, masses)
+        d, nrigid = rigid_body(self.coords, masses)
+        return _diagonalize(_project(hmw, d), masses, d, nrigid)
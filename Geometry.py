@@ -0,0 +1,209 @@
+#!/usr/bin/python
+
+# Streaming extraction of the geometries of a deMon2k output.
+
+import collections
+import mmap
+import os
+import re
+
+import numpy
+
+import Physcon
+
+# ----------------------------------------------------------------------
+
+#
+#     Purpose: Read the coordinates of every optimization or MD step of
+#              an output straight into one preallocated float64 array
+#              of shape (nframe, natom, 3), in memory or memory mapped
+#              as a .npy file, so trajectories larger than the RAM can
+#              be extracted and analysed.
+#
+#     ******************************************************************
+#
+#     List of variables:
+#
+#     HEADER  : Default pattern of the line preceding every geometry;
+#               the optional group unit (ANGSTROM or BOHR) gives the
+#               unit of the block.
+#     SKIP    : Maximum number of lines (column titles, rulers) between
+#               a header and the first atom line.
+#     Trajectory: Result of read(), the atomic numbers z (int16) and the
+#               coordinates (nframe, natom, 3).
+#
+#     The output is memory mapped and read in two passes: the first one
+#     locates the headers and takes the atom count, the line layout and
+#     the element labels from the first block, the second one converts
+#     block by block into the array. Atom lines are
+#
+#         [number] label x y z [more fields]
+#
+#     with the element symbol leading the label (O, O1, CL2), resolved
+#     through Physcon.ELSYM. All blocks must have the layout of the
+#     first one; an incomplete last block (running job) is ignored.
+#     Coordinates are converted in place with Physcon.BOHR into the
+#     requested unit.
+#
+#     ------------------------------------------------------------------
+#
+HEADER = rb'(?:ORIENTATION|COORDINATES) IN (?P<unit>ANGSTROM|BOHR)'
+
+SKIP = 4
+
+Trajectory = collections.namedtuple('Trajectory', 'z coords')
+
+_UNITS = ('bohr', 'angstrom')
+_FLOAT = re.compile(rb'[-+]?(?:\d+\.\d*|\.\d+)(?:[Ee][-+]?\d+)?$')
+
+_Layout = collections.namedtuple('_Layout', 'skip natom nfield label size')
+#
+#     ------------------------------------------------------------------
+#
+def _element(label):
+    """Atomic number of an atom label, longest symbol prefix first."""
+    alpha = re.match(r'[A-Za-z]*', label).group()
+    for symbol in (alpha[:2], alpha[:1]):
+        z = Physcon.ELNUM.get(symbol.lower())
+        if symbol and z is not None:
+            return z
+    raise KeyError('no element symbol in atom label %r' % label)
+
+
+def _atom(fields, label=None, nfield=None):
+    """Index of the label field if fields form an atom line."""
+    if label is None:
+        label = next((k for k, field in enumerate(fields)
+                      if field[:1].isalpha()), None)
+        if label is None:
+            return None
+    if (len(fields) < label + 4 or (nfield and len(fields) != nfield)
+            or not fields[label][:1].isalpha()):
+        return None
+    if not all(_FLOAT.match(field) for field in fields[label + 1:label + 4]):
+        return None
+    return label
+
+
+def _lines(data, pos):
+    """Lines of data from pos on, with their start offsets."""
+    while pos < len(data):
+        stop = data.find(b'\n', pos)
+        if stop < 0:
+            stop = len(data)
+        yield pos, data[pos:stop]
+        pos = stop + 1
+
+
+def _layout(data, pos):
+    """Layout and atom labels of the block following offset pos."""
+    lines = _lines(data, pos)
+    for skip, (first, line) in zip(range(SKIP + 1), lines):
+        fields = line.split()
+        label = _atom(fields)
+        if label is not None:
+            break
+    else:
+        raise ValueError('no atom lines after the geometry header at '
+                         'byte %d' % pos)
+    nfield = len(fields)
+    labels = [fields[label].decode()]
+    end = len(data)
+    for start, line in lines:
+        fields = line.split()
+        if _atom(fields, label, nfield) is None:
+            end = start
+            break
+        labels.append(fields[label].decode())
+    return _Layout(skip, len(labels), nfield, label, end - first), labels
+
+
+def _block(data, pos, layout):
+    """(natom, 3) coordinates of the block following offset pos, or
+    None if the block is incomplete."""
+    for _ in range(layout.skip + 1):
+        pos = data.find(b'\n', pos) + 1
+        if pos == 0:
+            return None
+    # Fixed format lines: twice the size of the first block holds the
+    # block, unless the line widths vary a lot.
+    size = 2*layout.size + 1024
+    while True:
+        chunk = data[pos:pos + size]
+        lines = chunk.split(b'\n', layout.natom)
+        if len(lines) > layout.natom or pos + size >= len(data):
+            break
+        size *= 2
+    if len(lines) > layout.natom:
+        lines = lines[:layout.natom]
+    elif len(lines) < layout.natom or not chunk.endswith(b'\n'):
+        return None
+    fields = b' '.join(lines).split()
+    if len(fields) != layout.natom*layout.nfield:
+        raise ValueError('geometry block at byte %d does not match the '
+                         'layout of the first block' % pos)
+    fields = numpy.array(fields).reshape(layout.natom, layout.nfield)
+    return fields[:, layout.label + 1:layout.label + 4].astype(numpy.float64)
+
+
+def headers(data, header=HEADER):
+    """Offsets of the lines ending the geometry headers in data, and the
+    unit of each block (lower case, None if the header does not say)."""
+    pattern = re.compile(header, re.M) if isinstance(header, bytes) \
+        else header
+    offsets, units = [], []
+    for match in pattern.finditer(data):
+        offsets.append(match.end())
+        unit = match.groupdict().get('unit')
+        units.append(unit.decode().lower() if unit else None)
+    return offsets, units
+
+
+def read(path, out=None, unit='bohr', header=HEADER, default='angstrom'):
+    """Trajectory of all geometries in the output path.
+
+    out is None for an in-memory array, the name of a .npy file to
+    create memory mapped, or a float64 array of the right shape. unit
+    is the unit of the result and default the unit of blocks whose
+    header does not give one (bohr or angstrom).
+    """
+    unit, default = unit.lower(), default.lower()
+    if unit not in _UNITS or default not in _UNITS:
+        raise ValueError('units must be bohr or angstrom')
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            raise ValueError('%s is empty' % path)
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            offsets, units = headers(data, header)
+            if not offsets:
+                raise ValueError('no geometries found in %s' % path)
+            layout, labels = _layout(data, data.find(b'\n', offsets[0]) + 1)
+            if _block(data, offsets[-1], layout) is None:
+                offsets.pop()
+                units.pop()
+            z = numpy.array([_element(label) for label in labels],
+                            dtype=numpy.int16)
+            shape = (len(offsets), layout.natom, 3)
+            if out is None:
+                coords = numpy.empty(shape)
+            elif isinstance(out, (str, os.PathLike)):
+                coords = numpy.lib.format.open_memmap(
+                    out, mode='w+', dtype=numpy.float64, shape=shape)
+            else:
+                coords = out
+                if coords.shape != shape or coords.dtype != numpy.float64:
+                    raise ValueError('out must be a float64 array of '
+                                     'shape %s' % (shape,))
+            scale = {'bohr': 1.0, 'angstrom': Physcon.BOHR}
+            for k, pos in enumerate(offsets):
+                block = _block(data, pos, layout)
+                if block is None:
+                    raise ValueError('incomplete geometry block at byte %d'
+                                     % pos)
+                coords[k] = block
+                factor = scale[units[k] or default]/scale[unit]
+                if factor != 1.0:
+                    numpy.multiply(coords[k], factor, out=coords[k])
+    if isinstance(coords, numpy.memmap):
+        coords.flush()
+    return Trajectory(z, coords)
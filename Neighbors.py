@@ -0,0 +1,159 @@
+#!/usr/bin/python
+
+# Cell list neighbor search over NumPy coordinate arrays.
+
+import numpy
+
+# ----------------------------------------------------------------------
+
+#
+#     Purpose: All atom pairs closer than a cutoff in O(N), for the
+#              connectivity, coordination number and dispersion tools.
+#
+#     ******************************************************************
+#
+#     List of variables:
+#
+#     CHUNK   : Default number of atoms whose candidate pairs are
+#               generated at once. chunks() yields the pairs of every
+#               chunk separately, so reductions over the pairs (CN,
+#               dispersion, RDF) stay within bounded memory.
+#     OFFSETS : Half shell of neighbor cell offsets; together with the
+#               cell itself every pair of cells is visited once.
+#
+#     The atoms are sorted into cubic cells with an edge of at least the
+#     cutoff, so all partners of an atom lie in its own or the 26
+#     adjacent cells. Candidate pairs are generated with NumPy repeat
+#     and arange arithmetic, without Python loops over atoms.
+#
+#     With an orthorhombic periodic box the cells tile the box, the
+#     neighbor cells wrap around and distances follow the minimum image
+#     convention; the cutoff must not exceed half the shortest box edge.
+#     Box directions with fewer than three cells use a single cell.
+#
+#     ------------------------------------------------------------------
+#
+CHUNK = 1 << 14
+
+OFFSETS = numpy.array([(0, 0, 0)] + [(i, j, k)
+                      for i in (-1, 0, 1) for j in (-1, 0, 1)
+                      for k in (-1, 0, 1) if (i, j, k) > (0, 0, 0)])
+#
+#     ------------------------------------------------------------------
+#
+def _cells(coords, cutoff):
+    lower = coords.min(axis=0)
+    span = coords.max(axis=0) - lower
+    # Sparse systems get larger cells, at most about one per atom.
+    edge = max(cutoff, (numpy.prod(span + cutoff)/len(coords))**(1.0/3.0))
+    ncell = numpy.maximum(1, (span//edge).astype(numpy.int64))
+    index = numpy.minimum(((coords - lower)/edge).astype(numpy.int64),
+                          ncell - 1)
+    return index, ncell
+
+
+def _periodic_cells(coords, cutoff, box):
+    ncell = (box//cutoff).astype(numpy.int64)
+    ncell[ncell < 3] = 1
+    coords = coords - box*numpy.floor(coords/box)
+    index = numpy.minimum((coords*(ncell/box)).astype(numpy.int64),
+                          ncell - 1)
+    offsets = OFFSETS[(OFFSETS[:, ncell == 1] == 0).all(axis=1)]
+    return index, ncell, offsets
+
+
+def chunks(coords, cutoff, chunk=CHUNK, box=None):
+    """Generator of the atom pairs of pairs(), one (i, j, d) block per
+    chunk of atoms, so a caller reducing every block before asking for
+    the next one needs memory for about chunk atoms' pairs only."""
+    coords = numpy.ascontiguousarray(coords, dtype=numpy.float64)
+    natom = len(coords)
+    if natom < 2 or cutoff <= 0.0:
+        return
+    if box is None:
+        index, ncell = _cells(coords, cutoff)
+        offsets = OFFSETS
+    else:
+        box = numpy.asarray(box, dtype=numpy.float64).reshape(3)
+        if 2.0*cutoff > box.min():
+            raise ValueError('cutoff %g exceeds half the box edge %g'
+                             % (cutoff, box.min()))
+        index, ncell, offsets = _periodic_cells(coords, cutoff, box)
+    linear = numpy.ravel_multi_index(index.T, ncell)
+    order = numpy.argsort(linear, kind='stable')
+    linear = linear[order]
+    ncells = int(numpy.prod(ncell))
+    count = numpy.bincount(linear, minlength=ncells)
+    first = numpy.concatenate(([0], numpy.cumsum(count)[:-1]))
+    sorted_index = index[order]
+    sorted_coords = coords[order]
+
+    for begin in range(0, natom, chunk):
+        atoms = numpy.arange(begin, min(begin + chunk, natom))
+        found = []
+        for offset in offsets:
+            neighbor = sorted_index[atoms] + offset
+            if box is None:
+                inside = ((neighbor >= 0) & (neighbor < ncell)).all(axis=1)
+                a = atoms[inside]
+                if a.size == 0:
+                    continue
+                cell = numpy.ravel_multi_index(neighbor[inside].T, ncell)
+            else:
+                a = atoms
+                cell = numpy.ravel_multi_index(neighbor.T, ncell,
+                                               mode='wrap')
+            n = count[cell]
+            total = int(n.sum())
+            if total == 0:
+                continue
+            ii = numpy.repeat(a, n)
+            start = numpy.repeat(first[cell] - numpy.cumsum(n) + n, n)
+            jj = start + numpy.arange(total)
+            if not offset.any():
+                keep = jj > ii
+                ii, jj = ii[keep], jj[keep]
+            delta = sorted_coords[ii] - sorted_coords[jj]
+            if box is not None:
+                delta -= box*numpy.round(delta/box)
+            d = numpy.sqrt(numpy.square(delta).sum(axis=1))
+            keep = d <= cutoff
+            found.append((ii[keep], jj[keep], d[keep]))
+        if not found:
+            continue
+        i, j, d = (numpy.concatenate(part) for part in zip(*found))
+        if i.size == 0:
+            continue
+        i, j = order[i], order[j]
+        swap = i > j
+        i[swap], j[swap] = j[swap], i[swap]
+        yield i, j, d
+
+
+def pairs(coords, cutoff, chunk=CHUNK, box=None):
+    """Atom pairs (i, j) with i < j and |r_i - r_j| <= cutoff, with
+    minimum image distances if the orthorhombic box edges box are given.
+
+    Returns the int64 index arrays i, j and the float64 distances d.
+    The whole pair list is held at once; use chunks() to reduce it
+    block by block.
+    """
+    found = list(chunks(coords, cutoff, chunk, box))
+    if not found:
+        return (numpy.zeros(0, numpy.int64), numpy.zeros(0, numpy.int64),
+                numpy.zeros(0))
+    return tuple(numpy.concatenate(part) for part in zip(*found))
+
+
+def csr(i, j, natom):
+    """Symmetric CSR adjacency (indptr, indices) of the pairs (i, j).
+
+    The neighbors of atom a are indices[indptr[a]:indptr[a + 1]],
+    sorted in ascending order.
+    """
+    rows = numpy.concatenate((i, j))
+    cols = numpy.concatenate((j, i))
+    order = numpy.lexsort((cols, rows))
+    indptr = numpy.zeros(natom + 1, dtype=numpy.int64)
+    numpy.cumsum(numpy.bincount(rows, minlength=natom), out=indptr[1:])
+    return indptr, cols[order]
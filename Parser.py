@@ -0,0 +1,274 @@
+#!/usr/bin/python
+
+# Streaming parser of deMon2k output files.
+
+import collections
+import itertools
+import mmap
+import os
+import re
+
+# ----------------------------------------------------------------------
+
+#
+#     Purpose: Stream a deMon2k output file, memory mapped and read
+#              in place, yielding typed records for the lines the
+#              plotting tools are interested in. The mapping is handled
+#              in windows of about WINDOW bytes ending on a newline; the
+#              records of a window are yielded in file order before the
+#              next window is read. Inside a window the lines are
+#              located with one literal-prefixed pattern per record
+#              kind, each a fast scan of the window; only the matching
+#              lines are copied out.
+#
+#     ******************************************************************
+#
+#     List of variables:
+#
+#     FIELDS  : Quantities of the MD table columns by position, per
+#               ensemble, as read by the awk scripts Plotter.sh used.
+#     KINDS   : Record kinds and the record type yielded for each.
+#     MDFIELDS: Number of leading MD table fields kept.
+#     WINDOW  : Bytes of the mapping scanned per window, the window is
+#               extended to the end of its last line.
+#
+#     Records:
+#
+#     Energy  : Line containing TOTAL ENERGY, value of the 4th field.
+#     RmsForce: Line containing RMSQ FORCE, value of the 4th field.
+#     MaxForce: Line containing MAX FORCE, value of the 4th field.
+#     MDStep  : MD table row, the tuple of its first MDFIELDS fields
+#               with NaN for missing or non-numeric fields.
+#
+#     The step field of the optimization records counts the occurrences
+#     of the respective line, starting at 1. MD rows are not interpreted
+#     here: the ensemble decides which position holds which quantity
+#     (FIELDS) and is given by the caller, see also ensemble().
+#
+#     ------------------------------------------------------------------
+#
+Energy = collections.namedtuple('Energy', 'step energy')
+RmsForce = collections.namedtuple('RmsForce', 'step force')
+MaxForce = collections.namedtuple('MaxForce', 'step force')
+MDStep = collections.namedtuple('MDStep', 'fields')
+
+FIELDS = {'NVE': ('time', 'temp', 'ekin', 'epot', 'esys'),
+          'NVT': ('time', 'temp', 'ekin', 'epot', 'esys'),
+          'NPT': ('time', 'temp', 'pres', 'ekin', 'epot', 'esys')}
+
+KINDS = {'energy': Energy, 'rms': RmsForce, 'max': MaxForce, 'md': MDStep}
+
+MDFIELDS = 6
+
+WINDOW = 8 << 20
+#
+## Patterns of the interesting lines, from a marker to the end of the
+## line. Optimization keywords may appear anywhere in a line and are
+## plain literals, MD table rows start with " <number>.<digits>"; the
+## leading newline of the md pattern gives it a literal prefix too, so
+## every pattern is searched with a fast literal scan. _FIRST matches a
+## row at the start of the data.
+#
+_MARKERS = {'energy': re.compile(rb'TOTAL ENERGY[^\n]*'),
+            'rms':    re.compile(rb'RMSQ FORCE[^\n]*'),
+            'max':    re.compile(rb'MAX FORCE[^\n]*'),
+            'md':     re.compile(rb'\n( [ 0-9]+\.[0-9][^\n]*)')}
+
+_FIRST = re.compile(rb' [ 0-9]+\.[0-9][^\n]*')
+
+_HEADER = re.compile(rb'\n( TIME\b[^\n]*)')
+
+_MISSING = (float('nan'),)*MDFIELDS
+#
+#     ------------------------------------------------------------------
+#
+def _kinds(kinds):
+    unknown = set(kinds) - set(KINDS)
+    if unknown:
+        raise ValueError('unknown record kinds: %s'
+                         % ', '.join(sorted(unknown)))
+    return tuple(kind for kind in KINDS if kind in kinds)
+
+
+def _number(field):
+    try:
+        return float(field)
+    except ValueError:
+        return _MISSING[0]
+
+
+def _step(line):
+    fields = line.split()[:MDFIELDS]
+    try:
+        values = tuple(map(float, fields))
+    except ValueError:
+        values = tuple(map(_number, fields))
+    return values + _MISSING[len(values):]
+
+
+def _lines(data, kind, pos, end, offsets=None):
+    """List of the lines of data[pos:end] holding records of kind; pos
+    is the start of a line. offsets, if given, is extended with the
+    offsets in data of the matches, which order the lines of all kinds
+    as in the file."""
+    matches = _MARKERS[kind].finditer(data, pos, end)
+    first = _FIRST.match(data, pos, end) if kind == 'md' else None
+    if offsets is not None:
+        matches = list(matches)
+        offsets += [pos] if first else []
+        offsets += [match.start() for match in matches]
+    if kind == 'md':
+        return ([first.group()] if first else []) + [match.group(1)
+                                                      for match in matches]
+    rfind = data.rfind
+    return [data[rfind(b'\n', pos, match.start()) + 1 or pos:match.end()]
+            for match in matches]
+
+
+def _value(line):
+    try:
+        return float(line.split()[3])
+    except (IndexError, ValueError):
+        return None
+
+
+def values(data, kind, pos=0, end=None):
+    """List of the values of kind in the complete lines of data[pos:end]:
+    the 4th field of the optimization lines, tuples of the MDStep
+    fields for md.
+
+    data is any bytes-like object supporting rfind() and pos the start
+    of a line.
+    """
+    if end is None:
+        end = len(data)
+    lines = _lines(data, kind, pos, end)
+    if kind == 'md':
+        return list(map(_step, lines))
+    return [value for value in map(_value, lines) if value is not None]
+
+
+def _records(kind, items, step):
+    """List of the records of the values items of kind, the first one
+    numbered step + 1."""
+    if kind == 'md':
+        return list(map(MDStep, items))
+    return list(map(KINDS[kind], range(step + 1, step + len(items) + 1),
+                    items))
+
+
+def scan(data, kinds, counts, pos=0, end=None):
+    """List of the records of kinds in the complete lines of
+    data[pos:end] in file order, see values(); counts are the running
+    step counters."""
+    if end is None:
+        end = len(data)
+    if len(kinds) == 1:
+        kind, = kinds
+        items = values(data, kind, pos, end)
+        found = _records(kind, items, counts[kind])
+        counts[kind] += len(items)
+        return found
+    offsets = []
+    found = []
+    for kind in kinds:
+        start = len(offsets)
+        lines = _lines(data, kind, pos, end, offsets)
+        if kind == 'md':
+            items = list(map(_step, lines))
+        else:
+            items = list(map(_value, lines))
+            if None in items:
+                keep = [value is not None for value in items]
+                offsets[start:] = itertools.compress(offsets[start:], keep)
+                items = list(itertools.compress(items, keep))
+        found += _records(kind, items, counts[kind])
+        counts[kind] += len(items)
+    # Every kind is in file order, the sort merges the runs.
+    order = sorted(range(len(found)), key=offsets.__getitem__)
+    return list(map(found.__getitem__, order))
+
+
+class Stream:
+    """Incremental reader of an output file that may still be growing.
+
+    read() yields the records of the complete lines appended since the
+    previous call, window by window, and remembers the byte offset and
+    the step counters, so every byte is parsed once; windows() yields
+    the plain values instead. The offset advances as each window is
+    handed out. A file shorter than the offset is taken as rewritten
+    and read again from the start.
+    """
+
+    def __init__(self, path, kinds=tuple(KINDS)):
+        self.path = path
+        self.kinds = _kinds(kinds)
+        self.counts = dict.fromkeys(KINDS, 0)
+        self.offset = 0
+
+    def _windows(self, final):
+        """Iterator over (data, pos, end) of the windows of the new
+        complete lines, data being the mapping of the file."""
+        with open(self.path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            if size < self.offset:
+                self.counts = dict.fromkeys(KINDS, 0)
+                self.offset = 0
+            if size == self.offset:
+                return
+            with mmap.mmap(f.fileno(), size, access=mmap.ACCESS_READ) as data:
+                last = size if final else data.rfind(b'\n', self.offset) + 1
+                pos = self.offset
+                while pos < last:
+                    end = last
+                    if pos + WINDOW < last:
+                        end = (data.find(b'\n', pos + WINDOW - 1, last) + 1
+                               or last)
+                    yield data, pos, end
+                    # Release the pages of the window done with.
+                    done = pos - pos % mmap.PAGESIZE
+                    if hasattr(data, 'madvise') and end > done:
+                        data.madvise(mmap.MADV_DONTNEED, done, end - done)
+                    pos = end
+
+    def windows(self, final=False):
+        """Iterator over the dicts of the value lists of the kinds in
+        the windows of the new complete lines; final=True also consumes
+        a trailing line without newline."""
+        for data, pos, end in self._windows(final):
+            found = {kind: values(data, kind, pos, end)
+                     for kind in self.kinds}
+            for kind, items in found.items():
+                self.counts[kind] += len(items)
+            self.offset = end
+            yield found
+
+    def read(self, final=False):
+        """Iterator over the records of the new complete lines in file
+        order, see windows()."""
+        for data, pos, end in self._windows(final):
+            found = scan(data, self.kinds, self.counts, pos, end)
+            self.offset = end
+            yield from found
+
+
+def ensemble(path):
+    """Ensemble of the MD table of the output path from its first header
+    line: 'NPT' with a PRES column, 'NVT' (NVE or NVT) without, None if
+    the output has no MD table."""
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return None
+        with mmap.mmap(f.fileno(), size, access=mmap.ACCESS_READ) as data:
+            match = (_HEADER.match(b'\n' + data.readline())
+                     or _HEADER.search(data))
+            if match is None:
+                return None
+            header = match.group(1).split()
+    return 'NPT' if b'PRES' in header else 'NVT'
+
+
+def records(path, kinds=tuple(KINDS)):
+    """Iterator over the records of kinds found in the output file path."""
+    return Stream(path, kinds).read(final=True)
@@ -0,0 +1,370 @@
+#!/usr/bin/python
+
+# Data extraction backend of Plotter.sh.
+
+import argparse
+import math
+import signal
+import string
+import subprocess
+import sys
+import time
+
+import numpy
+
+import Cache
+import Parser
+import Stats
+
+# ----------------------------------------------------------------------
+
+#
+#     Purpose: Write the gnuplot data files of Plotter.sh from the
+#              records Parser streams window by window out of the
+#              deMon2k output, optionally following a running job.
+#
+#     ******************************************************************
+#
+#     List of variables:
+#
+#     COLUMNS : MD quantities averaged per ensemble, as (label, field).
+#     GNUPLOT : gnuplot script templates per run type.
+#     OPTFILES: Record types of an optimization and their file slot.
+#     POINTS  : Default number of buckets of the MD downsampling, about
+#               the width in pixels of one plot panel.
+#
+#     OPT: one value per line in the energy, RMS force and MAX force
+#          files.
+#     MD : table rows with t >= start, followed by the running averages
+#          of the COLUMNS quantities. Averages and standard deviations
+#          over the data points are printed to stdout. The columns are
+#          taken by position for the given ensemble (Parser.FIELDS), as
+#          the former awk scripts did; rows lacking one of them are
+#          skipped.
+#
+#     Long MD runs are downsampled before they are written: the rows are
+#     split into -points buckets along the time axis and only the first
+#     and last row of every bucket and the rows holding the minimum and
+#     maximum of every column are kept, so the plotted envelope is
+#     unchanged. The running averages and the printed statistics are
+#     computed over all rows before downsampling. -points 0 writes all
+#     rows; -follow always writes all rows.
+#
+#     The series are taken from the columnar cache of Cache, so a rerun
+#     with another -start value does not parse the output again;
+#     -nocache parses without reading or writing the cache. With -gpl
+#     the gnuplot script producing the -png file is written as well.
+#
+#     With -follow the output is polled every given number of seconds.
+#     Only newly appended lines are parsed, the data files are extended
+#     and the running averages continue from where they were, then the
+#     -gpl script is rerun. The loop ends on SIGINT or SIGTERM.
+#
+#     Usage: python Plotter.py -opt output dat rms max
+#            python Plotter.py -md NVE|NVT|NPT [-start t0] [-points n]
+#                   output dat
+#            [-nocache] [-title title -gpl gpl -png png]
+#            [-follow seconds]
+#
+#     ------------------------------------------------------------------
+#
+COLUMNS = {'NVE': (('T', 'temp'), ('E', 'esys')),
+           'NVT': (('T', 'temp'), ('E', 'esys')),
+           'NPT': (('T', 'temp'), ('p', 'pres'), ('E', 'esys'))}
+
+GNUPLOT = {
+'OPT': '''#!/usr/bin/gnuplot
+set terminal png size 640,640
+set size square
+set output "${png}"
+#
+set title "${title}. OPT"
+set xlabel "Step" textcolor rgb "blue"
+set ylabel "Energy [a.u.]" textcolor rgb "blue"
+set y2label "Force [a.u.]" textcolor rgb "blue"
+#
+set ytics nomirror
+set y2tics
+set format y  "%.2f"
+set format y2 "%.2f"
+#
+plot "${dat}" axes x1y1 with lines linewidth 3 title "Energy",\\
+     "${rms}" axes x1y2 with lines linewidth 3 title "RMS Force",\\
+     "${max}" axes x1y2 with lines linewidth 3 title "MAX Force"
+''',
+'NVE': '''#!/usr/bin/gnuplot
+set terminal png size 1000,500 font "sans-serif,10"
+set output "${png}"
+#
+set multiplot layout 1,2 title "${title}. MD ${mdtype}"
+set xlabel "Time [fs]"
+#
+ntics = 4
+stats "${dat}" using 1 name "time" nooutput
+set xtics time_max/ntics
+#
+set title "Temperature [K]" textcolor rgb "blue"
+plot "${dat}" using 1:2 with lines title "T(t)",\\
+     "" using 1:6 with lines linewidth 2.0 title "<T>"
+set title "Kinetic, Potential and System Energies [a.u.]"
+plot "${dat}" using 1:3 with lines title "E_{KIN}(t)",\\
+     "" using 1:4 with lines title "E_{POT}(t)",\\
+     "" using 1:5 with lines title "E_{SYS}(t)"
+''',
+'NPT': '''#!/usr/bin/gnuplot
+set terminal png size 800,800 font "sans-serif,10"
+set output "${png}"
+#
+set multiplot layout 2,2 title "${title}. MD ${mdtype}"
+set xlabel "Time [fs]"
+#
+ntics = 4
+stats "${dat}" using 1 name "time" nooutput
+set xtics time_max/ntics
+#
+set title "Temperature [K]" textcolor rgb "blue"
+plot "${dat}" using 1:2 with lines title "T(t)",\\
+     "" using 1:7 with lines linewidth 2.0 title "<T>"
+set title "Pressure [bar]"
+plot "${dat}" using 1:3 with lines title "p(t)",\\
+     "" using 1:8 with lines linewidth 2.0 title "<p>"
+set title "Kinetic, Potential and Total Energies [a.u.]"
+plot "${dat}" using 1:4 with lines title "E_{KIN}(t)",\\
+     "" using 1:5 with lines title "E_{POT}(t)",\\
+     "" using 1:($4+$5) with lines title "E_{TOT}(t)",\\
+     "" using 1:6 with lines title "E_{SYS}(t)"
+set title "System Energy [a.u.]"
+plot "${dat}" using 1:6 with lines title "E_{SYS}(t)",\\
+     "" using 1:9 with lines linewidth 2.0 title "<E_{SYS}>"
+'''}
+GNUPLOT['NVT'] = GNUPLOT['NVE']
+
+POINTS = {'NVE': 500, 'NVT': 500, 'NPT': 400}
+
+OPTFILES = {Parser.Energy: 0, Parser.RmsForce: 1, Parser.MaxForce: 2}
+OPTCOLUMNS = ('opt_energy', 'opt_rms', 'opt_max')
+OPTKINDS = ('energy', 'rms', 'max')
+#
+#     ------------------------------------------------------------------
+#
+def downsample(table, points):
+    """Sorted indices of the rows of table kept by min/max bucket
+    downsampling into points buckets (all rows for points < 1)."""
+    nrow = len(table)
+    if points < 1 or nrow <= 4*points:
+        return numpy.arange(nrow)
+    edges = numpy.linspace(0, nrow, points + 1).astype(numpy.int64)
+    bucket = numpy.repeat(numpy.arange(points), numpy.diff(edges))
+    keep = [edges[:-1], edges[1:] - 1]
+    for column in table.T:
+        for reduce in (numpy.minimum, numpy.maximum):
+            extreme = reduce.reduceat(column, edges[:-1])
+            hits = numpy.flatnonzero(column == extreme[bucket])
+            keep.append(hits[numpy.unique(bucket[hits],
+                                          return_index=True)[1]])
+    return numpy.unique(numpy.concatenate(keep))
+
+
+class MDSeries:
+    """Running averages of the MD quantities of one ensemble."""
+
+    def __init__(self, mdtype='NVE', start=0.0):
+        self.columns = COLUMNS[mdtype]
+        self.fields = Parser.FIELDS[mdtype]
+        # Positions of the averaged quantities in the table rows.
+        self.index = [self.fields.index(field) for _, field in self.columns]
+        self.start = start
+        self.count = 0
+        self.moments = [Stats.Moments() for _ in self.columns]
+
+    def add(self, step):
+        """Accumulate step; return its data file row, or None if the
+        step lies before start or lacks a field of the ensemble."""
+        values = list(step.fields[:len(self.fields)])
+        if not values[0] >= self.start or any(map(math.isnan, values)):
+            return None
+        self.count += 1
+        averages = []
+        for k, moments in zip(self.index, self.moments):
+            moments.push(values[k])
+            averages.append(moments.mean)
+        return ' '.join('%s' % value for value in values + averages) + '\n'
+
+    def extend(self, columns, points=0):
+        """Accumulate the rows of Cache columns; return the data file
+        rows of the accepted steps, downsampled into points buckets."""
+        table = [numpy.asarray(columns['md_%d' % (k + 1)])
+                 for k in range(len(self.fields))]
+        keep = table[0] >= self.start
+        for column in table[1:]:
+            keep &= ~numpy.isnan(column)
+        table = [column[keep] for column in table]
+        count = table[0].size
+        if count == 0:
+            return ''
+        steps = numpy.arange(self.count + 1, self.count + count + 1)
+        for k, moments in zip(self.index, self.moments):
+            values = table[k]
+            # Running mean continued from the accumulated moments.
+            table.append(moments.mean
+                         + numpy.cumsum(values - moments.mean)/steps)
+            moments.extend(values)
+        self.count += count
+        table = numpy.column_stack(table)
+        table = table[downsample(table[:, 1:], points)]
+        return ''.join(' '.join(map(repr, row)) + '\n'
+                       for row in table.tolist())
+
+    def summary(self):
+        """Averages and standard deviations of the COLUMNS quantities."""
+        return ([moments.mean for moments in self.moments],
+                [moments.std() for moments in self.moments])
+
+    def report(self):
+        """Summary in the format printed by Plotter.sh."""
+        if self.count == 0:
+            return ' No MD data points found.'
+        lines = [' Average and standard deviations over %d data points:'
+                 % self.count]
+        for (label, _), mean, std in zip(self.columns, *self.summary()):
+            lines.append(' %s %20.6f %20.6f' % (label, mean, std))
+        return '\n'.join(lines)
+
+
+def update(stream, files, series=None, final=False):
+    """Append the rows of the records new in stream to files.
+
+    files holds the open energy, RMS and MAX force files of an
+    optimization, or the single data file of an MD run together with
+    its MDSeries. Returns the number of rows written.
+    """
+    rows = 0
+    for record in stream.read(final):
+        if series is None:
+            files[OPTFILES[type(record)]].write('%s\n' % record[1])
+        else:
+            row = series.add(record)
+            if row is None:
+                continue
+            files[0].write(row)
+        rows += 1
+    for f in files:
+        f.flush()
+    return rows
+
+
+def series(path, cache=True, kinds=tuple(Parser.KINDS)):
+    """Cache columns of the records kinds of the output path."""
+    if cache:
+        return Cache.load(path, kinds=kinds)
+    return Cache.parse(path, kinds)
+
+
+def write_gnuplot(gpl, png, title, files, mdtype=None):
+    """Write the gnuplot script gpl plotting the data files into png.
+
+    files are the dat, rms and max files of an optimization (mdtype
+    None) or the single dat file of an MD run.
+    """
+    names = dict(zip(('dat', 'rms', 'max'), files))
+    script = string.Template(GNUPLOT[mdtype or 'OPT']).safe_substitute(
+        png=png, title=title, mdtype=mdtype, **names)
+    with open(gpl, 'w') as f:
+        f.write(script)
+
+
+def write_opt(path, dat, rms, mxf, cache=True, columns=None):
+    """Write energies, RMS and MAX forces of an optimization."""
+    if columns is None:
+        columns = series(path, cache, OPTKINDS)
+    for name, column in zip((dat, rms, mxf), OPTCOLUMNS):
+        with open(name, 'w') as f:
+            f.writelines('%r\n' % value for value in columns[column].tolist())
+
+
+def write_md(path, dat, mdtype='NVE', start=0.0, cache=True, columns=None,
+             points=None):
+    """Write MD rows with running averages, downsampled into points
+    buckets (POINTS by default); return the MDSeries."""
+    if columns is None:
+        columns = series(path, cache, ('md',))
+    if points is None:
+        points = POINTS[mdtype]
+    md = MDSeries(mdtype, start)
+    rows = md.extend(columns, points)
+    with open(dat, 'w') as f:
+        f.write(rows)
+    return md
+
+
+def follow(stream, files, series, interval, gnuplot=None):
+    """Poll stream every interval seconds until interrupted.
+
+    After each poll with new rows the gnuplot script is rerun and, for
+    MD runs, the updated averages are printed.
+    """
+    try:
+        while True:
+            if update(stream, files, series):
+                if gnuplot:
+                    subprocess.run(['gnuplot', gnuplot],
+                                   stdout=subprocess.DEVNULL,
+                                   stderr=subprocess.DEVNULL)
+                if series is not None:
+                    print(series.report(), flush=True)
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        pass
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Data extraction backend of Plotter.sh.')
+    mode = parser.add_mutually_exclusive_group(required=True)
+    mode.add_argument('-opt', action='store_true')
+    mode.add_argument('-md', choices=sorted(COLUMNS), type=str.upper)
+    parser.add_argument('-start', type=float, default=0.0)
+    parser.add_argument('-points', type=int)
+    parser.add_argument('-follow', type=float, metavar='SECONDS')
+    parser.add_argument('-title', default='')
+    parser.add_argument('-gpl')
+    parser.add_argument('-png')
+    parser.add_argument('-nocache', dest='cache', action='store_false')
+    parser.add_argument('output')
+    parser.add_argument('files', nargs='+')
+    args = parser.parse_args(argv)
+
+    if args.opt and len(args.files) != 3:
+        parser.error('-opt needs the dat, rms and max file names')
+    if args.gpl:
+        png = args.png or args.gpl.rsplit('.', 1)[0] + '.png'
+        write_gnuplot(args.gpl, png, args.title, args.files, args.md)
+
+    if args.follow is None:
+        if args.opt:
+            write_opt(args.output, *args.files, cache=args.cache)
+            return 0
+        md = write_md(args.output, args.files[0], args.md, args.start,
+                      args.cache, points=args.points)
+        print(md.report())
+        return 0 if md.count else 1
+
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+    if args.opt:
+        stream = Parser.Stream(args.output, OPTKINDS)
+        series = None
+    else:
+        stream = Parser.Stream(args.output, ('md',))
+        series = MDSeries(args.md, args.start)
+    names = args.files[:3] if series is None else args.files[:1]
+    files = [open(name, 'w') for name in names]
+    try:
+        follow(stream, files, series, args.follow, args.gpl)
+    finally:
+        for f in files:
+            f.close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,200 @@
+#!/usr/bin/python
+
+# Radial distribution functions and coordination numbers of MD runs.
+
+import concurrent.futures
+import mmap
+
+import numpy
+
+import Elements
+import Neighbors
+import Physcon
+
+# ----------------------------------------------------------------------
+
+#
+#     Purpose: Element pair radial distribution functions g_ab(r) and
+#              running coordination numbers n_ab(r) of periodic NVT or
+#              NPT trajectories, accumulated frame by frame from the
+#              minimum image pair distances of Neighbors.chunks().
+#
+#     ******************************************************************
+#
+#     List of variables:
+#
+#     NBINS   : Default number of histogram bins.
+#
+#     For every frame the pair distances up to rmax are binned per
+#     element pair with one bincount call. The histograms are kept as
+#     exact int64 counts and, for the normalization with the volume V of
+#     each frame (NPT), as sums of counts*V:
+#
+#         g_ab(r) = sum_f h_ab,f(r)*V_f/(nframe*N_ab*4/3*pi*(r2**3-r1**3))
+#
+#     with N_ab = N_a*N_b for a != b and N_a*(N_a - 1)/2 for a = b.
+#     Partial results of frame blocks merge by adding the sums, so the
+#     process parallel rdf() gives the counts of a serial run exactly.
+#     Coordinates and box edges are in Bohr; boxes are orthorhombic,
+#     one (3,) box for all frames (NVT) or one per frame (NPT).
+#
+#     ------------------------------------------------------------------
+#
+NBINS = 200
+#
+#     ------------------------------------------------------------------
+#
+class RDF:
+    """Incremental RDF histograms of a fixed set of atoms.
+
+    pairs lists the element pairs (atomic numbers or symbols) to
+    analyse, by default every pair of the elements present.
+    """
+
+    def __init__(self, z, rmax, nbins=NBINS, pairs=None):
+        self.z = numpy.asarray(z, dtype=numpy.int64)
+        self.rmax = float(rmax)
+        self.nbins = nbins
+        elements = numpy.unique(self.z)
+        if pairs is None:
+            pairs = [(a, b) for k, a in enumerate(elements.tolist())
+                     for b in elements.tolist()[k:]]
+        self.pairs = [tuple(sorted(Elements.atomic_number(e)
+                                   if isinstance(e, str) else int(e)
+                                   for e in pair)) for pair in pairs]
+        # Pair type of every element combination, -1 if not analysed.
+        self.table = numpy.full((Elements.NELEM, Elements.NELEM), -1,
+                                dtype=numpy.int64)
+        for k, (a, b) in enumerate(self.pairs):
+            self.table[a, b] = self.table[b, a] = k
+        self.counts = numpy.zeros((len(self.pairs), nbins),
+                                  dtype=numpy.int64)
+        self.weighted = numpy.zeros((len(self.pairs), nbins))
+        self.nframe = 0
+
+    @property
+    def edges(self):
+        """Bin edges [Bohr]."""
+        return numpy.linspace(0.0, self.rmax, self.nbins + 1)
+
+    @property
+    def r(self):
+        """Bin centers [Bohr]."""
+        edges = self.edges
+        return 0.5*(edges[1:] + edges[:-1])
+
+    @property
+    def labels(self):
+        """Element pair labels, e.g. O-H."""
+        return ['-'.join(Physcon.ELSYM[k].strip() for k in pair)
+                for pair in self.pairs]
+
+    def add(self, coords, box):
+        """Accumulate one frame (natom, 3) in the box with edges box."""
+        counts = numpy.zeros(self.counts.size, dtype=numpy.int64)
+        for i, j, d in Neighbors.chunks(coords, self.rmax, box=box):
+            kind = self.table[self.z[i], self.z[j]]
+            keep = (kind >= 0) & (d < self.rmax)
+            bins = (d[keep]*(self.nbins/self.rmax)).astype(numpy.int64)
+            counts += numpy.bincount(kind[keep]*self.nbins + bins,
+                                     minlength=self.counts.size)
+        counts = counts.reshape(self.counts.shape)
+        self.counts += counts
+        self.weighted += counts*float(numpy.prod(box))
+        self.nframe += 1
+        return self
+
+    def extend(self, frames, boxes):
+        """Accumulate a stack of frames (nframe, natom, 3) with one box
+        (3,) or one box per frame (nframe, 3)."""
+        boxes = numpy.asarray(boxes, dtype=numpy.float64)
+        if boxes.ndim == 1:
+            boxes = numpy.broadcast_to(boxes, (len(frames), 3))
+        for coords, box in zip(frames, boxes):
+            self.add(coords, box)
+        return self
+
+    def merge(self, other):
+        """Add the histograms of other (same atoms, pairs and bins)."""
+        if (other.pairs != self.pairs or other.nbins != self.nbins
+                or other.rmax != self.rmax):
+            raise ValueError('cannot merge RDFs of different pairs or bins')
+        self.counts += other.counts
+        self.weighted += other.weighted
+        self.nframe += other.nframe
+        return self
+
+    def __iadd__(self, other):
+        return self.merge(other)
+
+    def _npairs(self):
+        count = numpy.bincount(self.z, minlength=Elements.NELEM)
+        return numpy.array([count[a]*(count[a] - 1)/2 if a == b
+                            else count[a]*count[b]
+                            for a, b in self.pairs], dtype=numpy.float64)
+
+    def g(self):
+        """(npair, nbins) radial distribution functions."""
+        shell = 4.0/3.0*numpy.pi*numpy.diff(self.edges**3)
+        norm = self.nframe*self._npairs()[:, numpy.newaxis]*shell
+        with numpy.errstate(invalid='ignore', divide='ignore'):
+            return numpy.where(norm > 0.0, self.weighted/norm, 0.0)
+
+    def coordination(self):
+        """(npair, nbins) running coordination numbers n_ab(r): mean
+        number of b atoms within the bin's upper edge around an a atom
+        (around the first element of the pair)."""
+        count = numpy.bincount(self.z, minlength=Elements.NELEM)
+        around = numpy.array([count[a] for a, _ in self.pairs],
+                             dtype=numpy.float64)
+        both = numpy.array([2.0 if a == b else 1.0 for a, b in self.pairs])
+        with numpy.errstate(invalid='ignore', divide='ignore'):
+            scale = numpy.where(around > 0.0,
+                                both/(around*max(self.nframe, 1)), 0.0)
+        return numpy.cumsum(self.counts, axis=1)*scale[:, numpy.newaxis]
+#
+#     ------------------------------------------------------------------
+#
+def _block(source, begin, end, boxes, z, rmax, nbins, pairs):
+    if isinstance(source, tuple):
+        # Memory mapped frames are reopened in the worker instead of
+        # being pickled.
+        filename, offset, shape = source
+        source = numpy.memmap(filename, dtype=numpy.float64, mode='r',
+                              offset=offset, shape=shape)
+    return RDF(z, rmax, nbins, pairs).extend(source[begin:end], boxes)
+
+
+def rdf(frames, z, boxes, rmax, nbins=NBINS, pairs=None, processes=None):
+    """RDF of a stack of frames (nframe, natom, 3), see RDF.
+
+    processes > 1 distributes blocks of frames over a process pool and
+    merges the partial histograms. Memory mapped frames (Geometry.read
+    with a .npy file, Trajectory.read_binary) are opened by each worker.
+    """
+    result = RDF(z, rmax, nbins, pairs)
+    nframe = len(frames)
+    boxes = numpy.asarray(boxes, dtype=numpy.float64)
+    if boxes.ndim == 1:
+        boxes = numpy.broadcast_to(boxes, (nframe, 3))
+    if not processes or processes < 2 or nframe < 2:
+        return result.extend(frames, boxes)
+    # Only a whole mapping (not a view of one) has a valid offset.
+    mapped = (isinstance(frames, numpy.memmap)
+              and isinstance(frames.base, mmap.mmap)
+              and frames.dtype == numpy.float64)
+    bounds = numpy.linspace(0, nframe, min(processes, nframe) + 1)
+    bounds = bounds.astype(numpy.int64)
+    futures = []
+    with concurrent.futures.ProcessPoolExecutor(processes) as pool:
+        for begin, end in zip(bounds[:-1], bounds[1:]):
+            box = boxes[begin:end]
+            if mapped:
+                source = (frames.filename, frames.offset, frames.shape)
+            else:
+                source, begin, end = frames[begin:end], 0, end - begin
+            futures.append(pool.submit(_block, source, begin, end, box,
+                                       result.z, rmax, nbins, result.pairs))
+        for future in futures:
+            result.merge(future.result())
+    return result
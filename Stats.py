@@ -0,0 +1,213 @@
+#!/usr/bin/python
+
+# Numerically stable streaming statistics for MD time series.
+
+import math
+
+import numpy
+
+# ----------------------------------------------------------------------
+
+#
+#     Purpose: Mean and variance accumulators (Welford updates, Chan et
+#              al. merges), block averaging and integrated
+#              autocorrelation time of MD series (T, p, E_KIN, E_POT,
+#              E_SYS).
+#
+#     ******************************************************************
+#
+#     Lit.: B.P. Welford, Technometrics 4, 419 (1962)
+#           T.F. Chan, G.H. Golub, R.J. LeVeque, Am. Stat. 37, 242 (1983)
+#           H. Flyvbjerg, H.G. Petersen, J. Chem. Phys. 91, 461 (1989)
+#           A.D. Sokal, Monte Carlo Methods in Statistical Mechanics
+#           (1996), automatic windowing of the autocorrelation sum.
+#
+#     Moments are accumulated as count, mean and sum of squared
+#     deviations (m2), never as sum and sum of squares, so energies of
+#     -10**4 Hartree over 10**6 steps keep their precision. Partial
+#     results of chunks or workers merge exactly with merge() or +.
+#
+#     ------------------------------------------------------------------
+#
+class Moments:
+    """Count, mean and squared deviations of a stream of values."""
+
+    __slots__ = ('count', 'mean', 'm2')
+
+    def __init__(self, count=0, mean=0.0, m2=0.0):
+        self.count = count
+        self.mean = mean
+        self.m2 = m2
+
+    @classmethod
+    def of(cls, values):
+        """Moments of an array of values."""
+        values = numpy.asarray(values, dtype=numpy.float64).ravel()
+        if values.size == 0:
+            return cls()
+        mean = values.mean()
+        return cls(values.size, float(mean),
+                   float(numpy.square(values - mean).sum()))
+
+    def push(self, value):
+        """Add one value (Welford update)."""
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta/self.count
+        self.m2 += delta*(value - self.mean)
+
+    def extend(self, values):
+        """Add an array of values."""
+        return self.merge(Moments.of(values))
+
+    def merge(self, other):
+        """Combine with the moments of other in place (Chan et al.)."""
+        if other.count == 0:
+            return self
+        if self.count == 0:
+            self.count, self.mean, self.m2 = other.count, other.mean, other.m2
+            return self
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta*other.count/count
+        self.m2 += other.m2 + delta**2*self.count*other.count/count
+        self.count = count
+        return self
+
+    def __iadd__(self, other):
+        return self.merge(other)
+
+    def __add__(self, other):
+        return Moments(self.count, self.mean, self.m2).merge(other)
+
+    def var(self, ddof=0):
+        """Variance, population (ddof=0) or sample (ddof=1)."""
+        if self.count <= ddof:
+            return math.nan
+        return self.m2/(self.count - ddof)
+
+    def std(self, ddof=0):
+        """Standard deviation."""
+        return math.sqrt(self.var(ddof))
+
+    def __repr__(self):
+        return 'Moments(count=%d, mean=%r, m2=%r)' % (self.count, self.mean,
+                                                     self.m2)
+
+
+class Blocks:
+    """Block averages over blocks of size consecutive steps.
+
+    Block k covers the steps [k*size, (k+1)*size) of the whole series.
+    A worker processing a chunk passes the index of its first step, so
+    partial blocks at the chunk edges line up and merge() of the
+    accumulators of all chunks is exact.
+    """
+
+    def __init__(self, size, start=0):
+        self.size = size
+        self.next = start
+        self.means = Moments()
+        self.partial = {}
+
+    def extend(self, values):
+        """Add the values of steps next, next + 1, ..."""
+        values = numpy.asarray(values, dtype=numpy.float64).ravel()
+        first = self.next
+        self.next += values.size
+        head = min(values.size, -first % self.size)
+        if head:
+            self._add_partial(first//self.size, Moments.of(values[:head]))
+        body = (values.size - head)//self.size*self.size
+        if body:
+            blocks = values[head:head + body].reshape(-1, self.size)
+            self.means.extend(blocks.mean(axis=1))
+        rest = values[head + body:]
+        if rest.size:
+            self._add_partial((first + head + body)//self.size,
+                              Moments.of(rest))
+        return self
+
+    def merge(self, other):
+        """Combine with the accumulator of another chunk in place."""
+        if other.size != self.size:
+            raise ValueError('cannot merge blocks of size %d and %d'
+                             % (self.size, other.size))
+        self.means.merge(other.means)
+        for block, moments in other.partial.items():
+            self._add_partial(block, moments)
+        self.next = max(self.next, other.next)
+        return self
+
+    def _add_partial(self, block, moments):
+        moments = self.partial.pop(block, Moments()).merge(moments)
+        if moments.count == self.size:
+            self.means.push(moments.mean)
+        else:
+            self.partial[block] = moments
+
+    @property
+    def count(self):
+        """Number of complete blocks."""
+        return self.means.count
+
+    def error(self):
+        """Standard error of the mean from the complete blocks, NaN
+        with fewer than two blocks."""
+        if self.means.count < 2:
+            return math.nan
+        return math.sqrt(self.means.var(1)/self.means.count)
+
+
+def block_analysis(values, min_blocks=4):
+    """Standard errors of the mean for block sizes 1, 2, 4, ...
+
+    Returns the block sizes and the errors; a plateau of the errors is
+    the error estimate of a correlated series (Flyvbjerg-Petersen).
+    """
+    values = numpy.asarray(values, dtype=numpy.float64).ravel()
+    sizes, errors = [], []
+    size = 1
+    while values.size//size >= min_blocks:
+        means = values[:values.size//size*size].reshape(-1, size).mean(axis=1)
+        sizes.append(size)
+        errors.append(math.sqrt(means.var(ddof=1)/means.size))
+        size *= 2
+    return numpy.array(sizes), numpy.array(errors)
+
+
+def autocorrelation(values):
+    """Normalized autocorrelation function of a series (FFT based)."""
+    values = numpy.asarray(values, dtype=numpy.float64).ravel()
+    if values.size == 0:
+        return values
+    values = values - values.mean()
+    n = values.size
+    nfft = 1 << (2*n - 1).bit_length()
+    spectrum = numpy.fft.rfft(values, nfft)
+    acf = numpy.fft.irfft(spectrum*spectrum.conjugate(), nfft)[:n]
+    if acf[0] == 0.0:
+        return numpy.ones(n)
+    return acf/acf[0]
+
+
+def integrated_time(values, c=5.0):
+    """Integrated autocorrelation time tau_int (in steps).
+
+    tau_int = 1/2 + sum_t rho(t), summed up to the first window M with
+    M >= c*tau_int (Sokal). An uncorrelated series gives 1/2, a series
+    of fewer than two values NaN.
+    """
+    rho = autocorrelation(values)
+    if rho.size < 2:
+        return math.nan
+    taus = numpy.cumsum(rho) - 0.5
+    window = numpy.arange(rho.size) >= c*taus
+    m = numpy.argmax(window) if window.any() else rho.size - 1
+    return float(taus[m])
+
+
+def statistical_inefficiency(values, c=5.0):
+    """Statistical inefficiency g = 2*tau_int, the number of steps per
+    independent sample."""
+    return 2.0*integrated_time(values, c)
@@ -0,0 +1,103 @@
+#!/usr/bin/python
+
+# Cartesian component tables of electrostatic moment tensors.
+
+import collections
+import functools
+import itertools
+
+import numpy
+
+import Physcon
+
+# ----------------------------------------------------------------------
+
+#
+#     Purpose: Component index arrays, labels, symmetry-unique subsets
+#              and ESU conversion factors of rank L Cartesian tensors,
+#              1 <= L <= Physcon.MAXMOM, generated once per rank.
+#
+#     ******************************************************************
+#
+#     List of variables:
+#
+#     Components: Table of one rank with the fields
+#                 rank    : Tensor rank L.
+#                 index   : (3**L, L) Cartesian indices of all
+#                           components in C (row-major) order.
+#                 labels  : Labels of all components (xx, xy, ...).
+#                 unique  : (NUNIQUE, L) indices i <= j <= ... of the
+#                           symmetry-unique components.
+#                 ulabels : Labels of the unique components.
+#                 first   : (NUNIQUE,) first component of every unique
+#                           component.
+#                 position: (3**L,) unique component of every component.
+#                 weight  : (NUNIQUE,) number of components equal to
+#                           each unique component.
+#                 esu     : Conversion factor [a.u.] -> [esu] (ESU[L-1]).
+#
+#     Labels are built from the seeds Physcon.XYZ by default; ABC or NOS
+#     give frequency or matrix style labels. All arrays are read-only.
+#     The tables are regenerated after Physcon.set_codata().
+#
+#     ------------------------------------------------------------------
+#
+Components = collections.namedtuple('Components', 'rank index labels unique'
+                                    ' ulabels first position weight esu')
+#
+#     ------------------------------------------------------------------
+#
+def _readonly(array):
+    array.flags.writeable = False
+    return array
+
+
+@functools.lru_cache(maxsize=None)
+def _components(rank, seeds):
+    if not 1 <= rank <= Physcon.MAXMOM:
+        raise ValueError('tensor rank must lie in [1, %d]' % Physcon.MAXMOM)
+    index = numpy.array(list(itertools.product(range(3), repeat=rank)),
+                        dtype=numpy.int8)
+    unique, first, position, weight = numpy.unique(
+        numpy.sort(index, axis=1), axis=0, return_index=True,
+        return_inverse=True, return_counts=True)
+    labels = tuple(''.join(seeds[k] for k in row) for row in index.tolist())
+    ulabels = tuple(''.join(seeds[k] for k in row)
+                    for row in unique.tolist())
+    return Components(rank, _readonly(index), labels, _readonly(unique),
+                      ulabels, _readonly(first),
+                      _readonly(position.ravel()),
+                      _readonly(weight), Physcon.ESU[rank - 1])
+
+
+def components(rank, seeds=None):
+    """Components table of rank rank (memoized per rank and seeds)."""
+    return _components(rank, tuple(seeds or Physcon.XYZ))
+
+
+def to_esu(values, rank):
+    """Tensor components [a.u.] of rank rank in esu units, for any
+    leading shape."""
+    return numpy.multiply(values, components(rank).esu)
+
+
+def reduce(tensors, rank):
+    """Symmetry-unique components (..., NUNIQUE) of full tensors given
+    either as (..., 3**L) or (..., 3, ..., 3)."""
+    tensors = numpy.asarray(tensors)
+    if tensors.shape[-rank:] == (3,)*rank:
+        tensors = tensors.reshape(tensors.shape[:-rank] + (3**rank,))
+    return tensors[..., components(rank).first]
+
+
+def expand(values, rank):
+    """Full symmetric tensors (..., 3, ..., 3) from their unique
+    components (..., NUNIQUE)."""
+    values = numpy.asarray(values)
+    full = values[..., components(rank).position]
+    return full.reshape(values.shape[:-1] + (3,)*rank)
+
+
+@Physcon.on_codata
+def _reset():
+    _components.cache_clear()
@@ -0,0 +1,175 @@
+#!/usr/bin/python
+
+# Ideal gas rigid rotor harmonic oscillator thermochemistry.
+
+import collections
+import math
+
+import numpy
+
+import Physcon
+
+# ----------------------------------------------------------------------
+
+#
+#     Purpose: Zero-point energy, enthalpy, entropy and Gibbs free energy
+#              of many conformers at many temperatures at once, from
+#              ragged sets of harmonic wave numbers, molecular masses and
+#              rotational constants (ideal gas, RRHO).
+#
+#     Lit.: D.A. McQuarrie, Statistical Mechanics (1976)
+#           R.F. Ribeiro et al., J. Phys. Chem. B 115, 14556 (2011)
+#           S. Grimme, Chem. Eur. J. 18, 9955 (2012)
+#
+#     ******************************************************************
+#
+#     List of variables:
+#
+#     BAV     : Average moment of inertia of the free rotor model
+#               [kg*m**2] (Grimme).
+#     CUTOFF  : Default low-frequency threshold [1/cm].
+#     LOWFREQ : Low-frequency treatments:
+#               'rrho'   : Harmonic oscillators throughout.
+#               'cutoff' : Wave numbers below CUTOFF raised to CUTOFF
+#                          (quasi-harmonic, Truhlar).
+#               'grimme' : Vibrational entropy interpolated towards the
+#                          free rotor entropy below CUTOFF (quasi-RRHO);
+#                          energies stay harmonic.
+#     Thermo  : Result of thermo() with the fields
+#               t  : (nt,) temperatures [K].
+#               zpe: (nconf,) zero-point energies [Hartree].
+#               h  : (nconf, nt) enthalpies H - E_el [Hartree], ZPE
+#                    included.
+#               s  : (nconf, nt) entropies [Hartree/K].
+#               g  : (nconf, nt) free energies H - T*S [Hartree].
+#
+#     The wave numbers of all conformers are handled as one flat array
+#     with segment offsets, so every quantity is a single (mode x T)
+#     NumPy evaluation followed by a segment sum. Imaginary modes (given
+#     as negative wave numbers) are skipped. Rotational constants are in
+#     1/cm; entries that are zero or infinite are ignored, leaving three
+#     (nonlinear), one or two equal (linear) or none (atom).
+#
+#     ------------------------------------------------------------------
+#
+BAV = 1.0E-44
+
+CUTOFF = 100.0
+
+LOWFREQ = ('rrho', 'cutoff', 'grimme')
+
+Thermo = collections.namedtuple('Thermo', 't zpe h s g')
+#
+#     ------------------------------------------------------------------
+#
+def ragged(freqs):
+    """Flat wave numbers and segment offsets (nconf + 1,) of a sequence
+    of frequency sets, or of a (values, offsets) pair passed through."""
+    if isinstance(freqs, tuple) and len(freqs) == 2:
+        values, offsets = freqs
+        return (numpy.asarray(values, dtype=numpy.float64),
+                numpy.asarray(offsets, dtype=numpy.int64))
+    sets = [numpy.asarray(f, dtype=numpy.float64).ravel() for f in freqs]
+    offsets = numpy.zeros(len(sets) + 1, dtype=numpy.int64)
+    numpy.cumsum([len(f) for f in sets], out=offsets[1:])
+    values = numpy.concatenate(sets) if sets else numpy.zeros(0)
+    return values, offsets
+
+
+def _segment_sum(values, offsets):
+    """Sums over the segments of the rows of values (nvalue, nt)."""
+    padded = numpy.concatenate((values,
+                                numpy.zeros((1,) + values.shape[1:])))
+    sums = numpy.add.reduceat(padded, offsets[:-1], axis=0)
+    sums[offsets[:-1] == offsets[1:]] = 0.0
+    return sums
+
+
+def _vibrations(values, offsets, t, lowfreq, cutoff):
+    """ZPE, thermal vibrational energy and entropy per conformer in J and
+    J/K per molecule."""
+    kt = Physcon.KBOLTZ*t
+    real = values > 0.0
+    if lowfreq == 'cutoff':
+        values = numpy.where(real, numpy.maximum(values, cutoff), values)
+    eps = numpy.where(real, Physcon.HPLANCK*Physcon.WAVESEC*values, 0.0)
+    x = eps[:, numpy.newaxis]/kt
+    with numpy.errstate(over='ignore', divide='ignore', invalid='ignore'):
+        boltz = numpy.where(real[:, numpy.newaxis], numpy.exp(-x), 0.0)
+        energy = eps[:, numpy.newaxis]*boltz/(1.0 - boltz)
+        entropy = numpy.where(real[:, numpy.newaxis],
+                              x*boltz/(1.0 - boltz) - numpy.log1p(-boltz),
+                              0.0)
+    if lowfreq == 'grimme':
+        # Free rotor with the moment of inertia of the mode; imaginary
+        # modes get a dummy wave number and are masked below.
+        safe = numpy.where(real, values, 1.0)
+        mu = Physcon.HPLANCK/(8.0*math.pi**2*Physcon.WAVESEC*safe)
+        mu = mu*BAV/(mu + BAV)
+        rotor = 0.5 + 0.5*numpy.log(8.0*math.pi**3*mu[:, numpy.newaxis]
+                                    *kt/Physcon.HPLANCK**2)
+        weight = 1.0/(1.0 + (cutoff/safe)**4)
+        weight = weight[:, numpy.newaxis]
+        entropy = numpy.where(real[:, numpy.newaxis],
+                              weight*entropy + (1.0 - weight)*rotor, 0.0)
+    zpe = _segment_sum(0.5*eps[:, numpy.newaxis], offsets)[:, 0]
+    return (zpe, _segment_sum(energy, offsets),
+            Physcon.KBOLTZ*_segment_sum(entropy, offsets))
+
+
+def _rotations(rotconst, t, symmetry):
+    """Rotational energy and entropy per conformer in J and J/K."""
+    kt = Physcon.KBOLTZ*t
+    b = numpy.asarray(rotconst, dtype=numpy.float64).reshape(-1, 3)
+    valid = numpy.isfinite(b) & (b > 0.0)
+    nvalid = valid.sum(axis=1)
+    # Rotational constants as energies h*c*B [J].
+    b = numpy.where(valid, Physcon.HPLANCK*Physcon.WAVESEC*b, 1.0)
+    logb = numpy.log(b).sum(axis=1)
+    sigma = numpy.broadcast_to(numpy.asarray(symmetry, dtype=numpy.float64),
+                               nvalid.shape)[:, numpy.newaxis]
+    nonlinear = (nvalid == 3)[:, numpy.newaxis]
+    linear = ((nvalid == 1) | (nvalid == 2))[:, numpy.newaxis]
+    # Linear molecules: geometric mean of the given constants.
+    blin = numpy.exp(logb/numpy.maximum(nvalid, 1))[:, numpy.newaxis]
+    s_nonlin = 1.5 + numpy.log(math.sqrt(math.pi)/sigma*kt**1.5
+                               /numpy.exp(0.5*logb)[:, numpy.newaxis])
+    s_lin = 1.0 + numpy.log(kt/(sigma*blin))
+    entropy = numpy.where(nonlinear, s_nonlin, numpy.where(linear, s_lin,
+                                                           0.0))
+    energy = numpy.where(nonlinear, 1.5*kt, numpy.where(linear, kt, 0.0))
+    return energy, Physcon.KBOLTZ*entropy
+
+
+def thermo(freqs, masses, rotconst, t=298.15, symmetry=1, multiplicity=1,
+           lowfreq='rrho', cutoff=CUTOFF, pressure=Physcon.PRESSURE):
+    """Thermochemistry of nconf conformers at the temperatures t [K].
+
+    freqs are the harmonic wave numbers [1/cm] of each conformer (see
+    ragged()), masses the molecular masses [amu] (nconf,), rotconst the
+    rotational constants [1/cm] (nconf, 3); symmetry numbers and spin
+    multiplicities are scalars or (nconf,) arrays. pressure is in Pa.
+    """
+    if lowfreq not in LOWFREQ:
+        raise ValueError('unknown low-frequency treatment %r' % lowfreq)
+    values, offsets = ragged(freqs)
+    nconf = len(offsets) - 1
+    t = numpy.atleast_1d(numpy.asarray(t, dtype=numpy.float64))
+    kt = Physcon.KBOLTZ*t
+    masses = numpy.broadcast_to(numpy.asarray(masses, dtype=numpy.float64),
+                                (nconf,))[:, numpy.newaxis]
+
+    zpe, e_vib, s_vib = _vibrations(values, offsets, t, lowfreq, cutoff)
+    e_rot, s_rot = _rotations(rotconst, t, symmetry)
+    mass = masses*Physcon.AMUKG
+    s_trans = Physcon.KBOLTZ*(2.5 + numpy.log(
+        (2.0*math.pi*mass*kt/Physcon.HPLANCK**2)**1.5*kt/pressure))
+    multiplicity = numpy.broadcast_to(
+        numpy.asarray(multiplicity, dtype=numpy.float64), (nconf,))
+    s_el = Physcon.KBOLTZ*numpy.log(multiplicity)[:, numpy.newaxis]
+
+    # H = E_trans + E_rot + ZPE + E_vib + kT, in Hartree.
+    joule = Physcon.JOULE
+    h = (2.5*kt + e_rot + zpe[:, numpy.newaxis] + e_vib)/joule
+    s = (s_trans + s_rot + s_vib + s_el)/joule
+    return Thermo(t, zpe/joule, h, s, h - t*s)
@@ -0,0 +1,203 @@
+#!/usr/bin/python
+
+# Buffered trajectory writer for XYZ, extended XYZ and binary frames.
+
+import os
+
+import numpy
+
+import Geometry
+import Physcon
+
+# ----------------------------------------------------------------------
+
+#
+#     Purpose: Write stacks of frames (nframe, natom, 3) for
+#              visualization or fast reload. Text frames are formatted
+#              with one %-operation on a per-system template instead of
+#              one per line, and written in blocks of frames.
+#
+#     ******************************************************************
+#
+#     List of variables:
+#
+#     BLOCK   : Frames formatted and written per write() call.
+#     FORMATS : Supported output formats:
+#               xyz   : Plain XYZ in Angstrom.
+#               extxyz: Extended XYZ with Properties, Lattice and per
+#                       frame key=value pairs in the comment line.
+#               binary: Header, atomic numbers and raw float64 frames
+#                       in Bohr, reloaded memory mapped by read_binary().
+#     MAGIC   : Leading bytes of the binary format.
+#
+#     Input coordinates are in Bohr (as read by Geometry.py) unless
+#     unit='angstrom' is given; text formats are converted to Angstrom
+#     with Physcon.BOHR frame block by frame block, the binary format
+#     keeps Bohr so a reload is bit for bit exact. Binary files can be
+#     appended to, the number of frames follows from the file size.
+#
+#     ------------------------------------------------------------------
+#
+BLOCK = 256
+
+FORMATS = ('xyz', 'extxyz', 'binary')
+
+MAGIC = b'DMTRAJ01'
+
+_HEADER = numpy.dtype([('magic', 'S8'), ('natom', '<i8')])
+#
+#     ------------------------------------------------------------------
+#
+def _template(z, digits):
+    """%-template of the atom lines of one frame."""
+    symbols = [Physcon.ELSYM[k].strip() for k in numpy.asarray(z).tolist()]
+    field = ' %%%d.%df' % (digits + 6, digits)
+    return ''.join('%-2s%s\n' % (symbol, 3*field) for symbol in symbols)
+
+
+def _value(value):
+    if isinstance(value, str):
+        return '"%s"' % value if ' ' in value else value
+    return repr(value.item() if hasattr(value, 'item') else value)
+
+
+class Writer:
+    """Trajectory file of a fixed set of atoms.
+
+    Frames passed to write() are appended to path in the format fmt.
+    A lattice (nframe, 3, 3) is indexed by the running frame count
+    nframe of the Writer, so frames may be written one at a time.
+    Use as a context manager or call close().
+    """
+
+    def __init__(self, path, z, fmt='xyz', unit='bohr', digits=8,
+                 append=False, lattice=None):
+        if fmt not in FORMATS:
+            raise ValueError('unknown trajectory format %r' % fmt)
+        if unit.lower() not in ('bohr', 'angstrom'):
+            raise ValueError('units must be bohr or angstrom')
+        self.z = numpy.asarray(z, dtype=numpy.int16)
+        self.natom = len(self.z)
+        self.fmt = fmt
+        self.unit = unit.lower()
+        self.lattice = lattice
+        self.nframe = 0
+        if fmt == 'binary':
+            self.file = self._open_binary(path, append)
+            return
+        self.file = open(path, 'a' if append else 'w')
+        self.template = _template(self.z, digits)
+        self.head = '%d\n' % self.natom
+        if fmt == 'extxyz':
+            self.head += 'Properties=species:S:1:pos:R:3'
+
+    def _open_binary(self, path, append):
+        if append and os.path.exists(path) and os.path.getsize(path):
+            z, _ = _binary_header(path)
+            if not numpy.array_equal(z, self.z):
+                raise ValueError('%s holds a different system' % path)
+            return open(path, 'ab')
+        f = open(path, 'wb')
+        header = numpy.array([(MAGIC, self.natom)], dtype=_HEADER)
+        f.write(header.tobytes())
+        f.write(self.z.astype('<i2').tobytes())
+        # Pad to 8 bytes, so the frames are aligned for memory mapping.
+        f.write(bytes(-f.tell() % 8))
+        return f
+
+    def write(self, coords, info=None, comments=None):
+        """Append one frame (natom, 3) or a stack (nframe, natom, 3).
+
+        info maps keys to one value per frame for the extended XYZ
+        comment line; comments gives the comment line of every frame of
+        the plain XYZ format.
+        """
+        coords = numpy.asarray(coords, dtype=numpy.float64)
+        if coords.ndim == 2:
+            coords = coords[numpy.newaxis]
+        if coords.shape[1:] != (self.natom, 3):
+            raise ValueError('coordinates of shape %s do not match %d atoms'
+                             % (coords.shape, self.natom))
+        if self.fmt == 'binary':
+            if self.unit == 'angstrom':
+                coords = coords*Physcon.BOHR
+            self.file.write(numpy.ascontiguousarray(coords, '<f8').tobytes())
+            self.nframe += len(coords)
+            return
+        scale = 1.0 if self.unit == 'angstrom' else 1.0/Physcon.BOHR
+        for begin in range(0, len(coords), BLOCK):
+            block = coords[begin:begin + BLOCK]*scale
+            lines = [self._comment(begin + k, info, comments)
+                     for k in range(len(block))]
+            self.file.write(''.join(
+                '%s%s\n%s' % (self.head, comment, self.template
+                              % tuple(frame))
+                for comment, frame in zip(lines,
+                                          block.reshape(len(block), -1)
+                                          .tolist())))
+        self.nframe += len(coords)
+
+    def _comment(self, k, info, comments):
+        if self.fmt == 'xyz':
+            return '' if comments is None else comments[k]
+        pairs = []
+        if self.lattice is not None:
+            lattice = numpy.asarray(self.lattice, dtype=numpy.float64)
+            if lattice.ndim == 3:
+                lattice = lattice[self.nframe + k]
+            if self.unit == 'bohr':
+                lattice = lattice/Physcon.BOHR
+            pairs.append('Lattice="%s"' % ' '.join(map(repr,
+                                                       lattice.ravel()
+                                                       .tolist())))
+        for key, values in (info or {}).items():
+            pairs.append('%s=%s' % (key, _value(values[k])))
+        return ' ' + ' '.join(pairs) if pairs else ''
+
+    def close(self):
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+#
+#     ------------------------------------------------------------------
+#
+def write(path, z, coords, fmt='xyz', unit='bohr', **options):
+    """Write the frames coords of the atoms z to path, see Writer."""
+    info = options.pop('info', None)
+    comments = options.pop('comments', None)
+    with Writer(path, z, fmt, unit, **options) as writer:
+        writer.write(coords, info, comments)
+
+
+def _binary_header(path):
+    with open(path, 'rb') as f:
+        header = numpy.frombuffer(f.read(_HEADER.itemsize), dtype=_HEADER)
+        if len(header) != 1 or header['magic'][0] != MAGIC:
+            raise ValueError('%s is not a binary trajectory' % path)
+        natom = int(header['natom'][0])
+        z = numpy.frombuffer(f.read(2*natom), dtype='<i2').astype(numpy.int16)
+    offset = _HEADER.itemsize + 2*natom
+    return z, offset + (-offset % 8)
+
+
+def read_binary(path, mmap=True):
+    """Geometry.Trajectory of a binary trajectory file, coordinates in
+    Bohr and memory mapped read-only unless mmap=False. An incomplete
+    last frame is ignored."""
+    z, offset = _binary_header(path)
+    frame = 3*8*len(z)
+    nframe = (os.path.getsize(path) - offset)//frame if frame else 0
+    shape = (nframe, len(z), 3)
+    if mmap and nframe:
+        coords = numpy.memmap(path, dtype='<f8', mode='r', offset=offset,
+                              shape=shape)
+    else:
+        with open(path, 'rb') as f:
+            f.seek(offset)
+            coords = numpy.frombuffer(f.read(nframe*frame),
+                                      dtype='<f8').reshape(shape).copy()
+    return Geometry.Trajectory(z, coords)
@@ -0,0 +1,130 @@
+#!/usr/bin/python
+
+# Dimension-aware unit conversion over the Physcon conversion factors.
+
+import functools
+
+import numpy
+
+import Physcon
+
+# ----------------------------------------------------------------------
+
+#
+#     Purpose: Conversion of scalars and NumPy arrays between units of
+#              the same dimension. The composite factor of a unit pair
+#              is resolved and cached once, then applied with a single
+#              vectorized multiply (in place with out=).
+#
+#     ******************************************************************
+#
+#     List of variables:
+#
+#     ALIAS   : Alternative spellings of the unit names.
+#     UNITS   : Unit name -> (dimension, numerator, denominator) with
+#               numerator/denominator units per atomic unit.
+#
+#     The table and the cached factors are rebuilt when another CODATA
+#     release is selected with Physcon.set_codata().
+#
+#     Unit names are case insensitive. Keeping each Physcon factor on
+#     its own side of the fraction makes the direct conversions (e.g.
+#     [Hartree] -> [eV] or [Angstrom] -> [Bohr]) bit-for-bit equal to
+#     the Physcon factors.
+#
+#     ------------------------------------------------------------------
+#
+def _units():
+    return {
+#
+## Energy, atomic unit [Hartree]
+#
+        'hartree':  ('energy', 1.0, 1.0),
+        'ev':       ('energy', Physcon.EVOLT, 1.0),
+        'kcal/mol': ('energy', Physcon.KCALMOL, 1.0),
+        'kj/mol':   ('energy', Physcon.KJMOL, 1.0),
+        'j':        ('energy', Physcon.JOULE, 1.0),
+        'hz':       ('energy', Physcon.HZ, 1.0),
+        'mhz':      ('energy', Physcon.MHZ, 1.0),
+        'cm-1':     ('energy', Physcon.WAVENUM, 1.0),
+#
+## Length, atomic unit [Bohr]
+#
+        'bohr':     ('length', 1.0, 1.0),
+        'angstrom': ('length', 1.0, Physcon.BOHR),
+        'm':        ('length', Physcon.ABOHR, 1.0),
+#
+## Time, atomic unit [hbar/Hartree]
+#
+        'au_time':  ('time', 1.0, 1.0),
+        'fs':       ('time', 1.0, Physcon.FSEC),
+        's':        ('time', 1.0E-15, Physcon.FSEC),
+#
+## Mass, atomic unit [electron mass]
+#
+        'au_mass':  ('mass', 1.0, 1.0),
+        'amu':      ('mass', 1.0, Physcon.AMU),
+        'kg':       ('mass', Physcon.EMASS, 1.0),
+#
+## Pressure, atomic unit [Hartree/Bohr**3]
+#
+        'au_pres':  ('pressure', 1.0, 1.0),
+        'pa':       ('pressure', Physcon.PASCAL, 1.0),
+        'bar':      ('pressure', Physcon.PASCAL, 1.0E5),
+        'gpa':      ('pressure', Physcon.PASCAL, 1.0E9),
+        }
+
+UNITS = _units()
+
+ALIAS = {
+    'eh': 'hartree', 'ha': 'hartree', 'au_energy': 'hartree',
+    'kcalmol': 'kcal/mol', 'kjmol': 'kj/mol', 'joule': 'j',
+    '1/cm': 'cm-1', 'cm^-1': 'cm-1', 'wavenumber': 'cm-1',
+    'a0': 'bohr', 'au_length': 'bohr', 'ang': 'angstrom',
+    'fsec': 'fs', 'sec': 's',
+    'me': 'au_mass',
+    'pascal': 'pa',
+}
+#
+#     ------------------------------------------------------------------
+#
+def _unit(name):
+    key = name.strip().lower()
+    key = ALIAS.get(key, key)
+    if key not in UNITS:
+        raise KeyError('unknown unit %r' % name)
+    return UNITS[key]
+
+
+@functools.lru_cache(maxsize=None)
+def factor(from_unit, to_unit):
+    """Multiplicative factor converting from_unit into to_unit.
+
+    Raises KeyError for unknown units and ValueError for units of
+    different dimensions.
+    """
+    from_dim, from_num, from_den = _unit(from_unit)
+    to_dim, to_num, to_den = _unit(to_unit)
+    if from_dim != to_dim:
+        raise ValueError('cannot convert %s [%s] to %s [%s]'
+                         % (from_unit, from_dim, to_unit, to_dim))
+    return (to_num/from_num)*(from_den/to_den)
+
+
+def convert(values, from_unit, to_unit, out=None):
+    """Convert values from from_unit into to_unit.
+
+    The factor is resolved before touching the data. With out=values
+    a floating point array is converted in place without temporaries.
+    """
+    scale = factor(from_unit, to_unit)
+    if out is None:
+        return numpy.multiply(values, scale)
+    return numpy.multiply(values, scale, out=out)
+
+
+@Physcon.on_codata
+def _reset():
+    UNITS.clear()
+    UNITS.update(_units())
+    factor.cache_clear()